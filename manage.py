@@ -194,9 +194,9 @@ def db(
 
 
 @app.command()
-def simulate(ballot_id: str, votes: int = 10):
+def simulate(ballot_id: str, votes: int = 10, concurrency: int = 20):
     """[bold white]SIMULATE[/bold white] voting traffic."""
-    run_simulation(ballot_id, votes)
+    run_simulation(ballot_id, votes, concurrency)
 
 
 # --- Quality Assurance ---
@@ -53,6 +53,9 @@ class BaseAppSettings(BaseSettings):
     aws_region: str = "us-east-1"
     localstack_endpoint: str | None = "http://localhost:4566"
 
+    # Caching
+    oponn_keyset_cache_size: int = 2048
+
     @property
     def is_production(self) -> bool:
         return self.oponn_env == "production"
@@ -27,6 +27,10 @@ from .services.kms_provider import MasterKeyProvider
 # Infrastructure singletons
 templates = Jinja2Templates(directory="templates")
 
+# Template files only change under the dev server's hot-reload; elsewhere
+# skip the per-render mtime check on every cached template
+templates.env.auto_reload = settings.oponn_env == "development"
+
 # Register template globals
 templates.env.globals.update(get_ballot_status=BallotService.get_status)
 
@@ -46,8 +50,13 @@ async def get_redis_client() -> aioredis.Redis | None:
         return None
     loop = asyncio.get_running_loop()
     if loop not in _redis_clients:
+        # Long-lived pubsub listeners sit idle between messages: keepalives and
+        # periodic health checks catch dead connections before a command does
         _redis_clients[loop] = aioredis.from_url(
-            str(settings.redis_url), decode_responses=False
+            str(settings.redis_url),
+            decode_responses=False,
+            health_check_interval=30,
+            socket_keepalive=True,
         )
     return _redis_clients[loop]
 
@@ -79,11 +88,20 @@ async def get_crypto_service() -> CryptoService:
             )
 
         _crypto_services[loop] = CryptoService(
-            provider=provider, redis_client=await get_redis_client()
+            provider=provider,
+            redis_client=await get_redis_client(),
+            l1_maxsize=settings.oponn_keyset_cache_size,
         )
     return _crypto_services[loop]
 
 
+async def close_crypto_service() -> None:
+    """Releases the loop's crypto service along with its KMS connection."""
+    crypto = _crypto_services.pop(asyncio.get_running_loop(), None)
+    if crypto:
+        await crypto.aclose()
+
+
 async def get_ballot_state_manager() -> BallotStateManager:
     loop = asyncio.get_running_loop()
     if loop not in _ballot_state_managers:
@@ -91,6 +109,13 @@ async def get_ballot_state_manager() -> BallotStateManager:
     return _ballot_state_managers[loop]
 
 
+async def close_ballot_state_manager() -> None:
+    """Stops the loop's shared Redis listener and pending broadcasts."""
+    state = _ballot_state_managers.pop(asyncio.get_running_loop(), None)
+    if state:
+        await state.aclose()
+
+
 async def get_in_memory_ballot_repo() -> InMemoryBallotRepository:
     loop = asyncio.get_running_loop()
     if loop not in _in_memory_ballot_repos:
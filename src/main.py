@@ -8,7 +8,12 @@ from fastapi import FastAPI, HTTPException, Request
 from starlette.staticfiles import StaticFiles
 
 from .config import ProductionSettings, TestingSettings, settings
-from .dependencies import CSRF_COOKIE_NAME, get_ballot_service
+from .dependencies import (
+    CSRF_COOKIE_NAME,
+    close_ballot_state_manager,
+    close_crypto_service,
+    get_ballot_service,
+)
 from .logging_conf import configure_logging
 from .models.exceptions import (
     BallotNotFoundError,
@@ -44,6 +49,9 @@ async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
         except asyncio.CancelledError:
             pass
 
+    await close_ballot_state_manager()
+    await close_crypto_service()
+
 
 async def background_reaper():
     """Periodically clean up stale ballot metadata."""
@@ -1,14 +1,35 @@
 from datetime import datetime, timedelta, timezone
 
-from bs4 import BeautifulSoup
-from pydantic import BaseModel, Field, ValidationError, ValidationInfo, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    ValidationInfo,
+    field_validator,
+)
 
 
 def sanitize_html(text: str) -> str:
     """Removes HTML tags from the given text."""
+    # Imported lazily: only write-in votes need it, and bs4 is slow to import
+    from bs4 import BeautifulSoup
+
     return BeautifulSoup(text, "html.parser").get_text()
 
 
+def parse_options_raw(raw: str) -> list[str]:
+    """Splits comma-separated options, stripping each once and dropping blanks."""
+    return [opt for part in raw.split(",") if (opt := part.strip())]
+
+
+def as_utc(value: datetime | None) -> datetime | None:
+    """Treats naive timestamps as UTC; aware ones are returned unchanged."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
 def format_pydantic_errors(
     e: ValidationError, field_mapping: dict[str, str] | None = None
 ) -> tuple[str | None, dict[str, str]]:
@@ -21,7 +42,8 @@ def format_pydantic_errors(
     field_errors: dict[str, str] = {}
     global_errors: list[str] = []
 
-    for err in e.errors():
+    # Only loc and msg are read, so skip building the url/ctx/input entries
+    for err in e.errors(include_url=False, include_context=False, include_input=False):
         loc = err["loc"]
         msg = err["msg"]
 
@@ -110,7 +132,7 @@ class BallotCreateForm(BaseModel):
     @classmethod
     def split_options(cls, v: str, info: ValidationInfo) -> str:
         """Ensure there's at least one non-empty option after splitting."""
-        opts = [o.strip() for o in v.split(",") if o.strip()]
+        opts = parse_options_raw(v)
         if not opts:
             raise ValueError("at least 1 item after validation")
 
@@ -137,9 +159,9 @@ class BallotCreateForm(BaseModel):
                 )
 
             try:
-                # Pydantic's datetime type could handle this, but since we receive a string
-                # that might need 'Z' normalization, we do it here.
-                st = datetime.fromisoformat(v.replace("Z", "+00:00"))
+                # Python 3.11+ parses the trailing 'Z' natively, so the string
+                # is handed to fromisoformat as-is.
+                st = datetime.fromisoformat(v)
                 if st < datetime.now(timezone.utc):
                     raise ValueError("Scheduled start time must be in the future")
             except ValueError as e:
@@ -151,12 +173,10 @@ class BallotCreateForm(BaseModel):
 
     def to_ballot_create(self) -> BallotCreate:
         """Converts the form data into the core BallotCreate domain model."""
-        options = [o.strip() for o in self.options_raw.split(",") if o.strip()]
+        options = parse_options_raw(self.options_raw)
 
         if self.start_time_type == "scheduled" and self.scheduled_start_time:
-            st = datetime.fromisoformat(
-                self.scheduled_start_time.replace("Z", "+00:00")
-            )
+            st = datetime.fromisoformat(self.scheduled_start_time)
         else:
             st = datetime.now(timezone.utc)
 
@@ -181,6 +201,12 @@ class Ballot(BallotBase):
     # Map of option_id -> option_text (decrypted)
     option_map: dict[int, str] = Field(default_factory=dict)
 
+    @field_validator("start_time", "end_time")
+    @classmethod
+    def ensure_utc(cls, v: datetime | None) -> datetime | None:
+        """Normalize naive timestamps to UTC once, so status checks only compare."""
+        return as_utc(v)
+
 
 class Vote(BaseModel):
     option_id: int | None = None  # Reference to existing option
@@ -230,3 +256,8 @@ class VoteForm(BaseModel):
 class Tally(BaseModel):
     option: str
     count: int
+
+
+# Encodes/decodes tally lists (SSE JSON feed, cross-worker Redis payload) in
+# one Rust-backed pass instead of model_dump() plus stdlib json
+tallies_adapter = TypeAdapter(list[Tally])
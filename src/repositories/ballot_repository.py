@@ -1,5 +1,6 @@
 import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import override
 
 
@@ -17,11 +18,21 @@ class BallotRepository(ABC):
         """Retrieve all ballots from storage."""
         pass
 
+    @abstractmethod
+    async def list_by_owner(self, owner_id: str) -> list[BallotTable]:
+        """Retrieve all ballots owned by a specific user."""
+        pass
+
     @abstractmethod
     async def get_by_id(self, ballot_id: str) -> BallotTable | None:
         """Retrieve a specific ballot by its unique ID."""
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, ballot_ids: Iterable[str]) -> list[BallotTable]:
+        """Retrieve every existing ballot among the given IDs in one call."""
+        pass
+
     @abstractmethod
     async def create_ballot_record(
         self,
@@ -48,6 +59,11 @@ class BallotRepository(ABC):
         """Adds a new write-in option and returns its ID."""
         pass
 
+    @abstractmethod
+    async def add_write_in_vote(self, ballot_id: str, encrypted_text: str) -> int:
+        """Adds a write-in option and one vote for it atomically; returns its ID."""
+        pass
+
     @abstractmethod
     async def get_tallies(self, ballot_id: str) -> list[tuple[int, int]]:
         """Retrieve the current vote counts for all options on a ballot."""
@@ -60,16 +76,22 @@ class InMemoryBallotRepository(BallotRepository):
     """
 
     ballots_db: dict[str, BallotTable]
+    owners_db: dict[str, list[str]]
     votes_db: dict[str, dict[int, int]]
     options_db: dict[str, list[dict[str, object]]]
     _lock: asyncio.Lock
     _opt_id_counter: int
 
     def __init__(self):
+        self._lock = asyncio.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drops all stored data by swapping in fresh containers."""
         self.ballots_db = {}
+        self.owners_db = {}  # owner_id -> list of ballot_ids
         self.votes_db = {}
         self.options_db = {}  # ballot_id -> list of options
-        self._lock = asyncio.Lock()
         self._opt_id_counter = 1
 
     @override
@@ -77,11 +99,27 @@ class InMemoryBallotRepository(BallotRepository):
         async with self._lock:
             return list(self.ballots_db.values())
 
+    @override
+    async def list_by_owner(self, owner_id: str) -> list[BallotTable]:
+        async with self._lock:
+            return [
+                self.ballots_db[bid]
+                for bid in self.owners_db.get(owner_id, [])
+                if bid in self.ballots_db
+            ]
+
     @override
     async def get_by_id(self, ballot_id: str) -> BallotTable | None:
         async with self._lock:
             return self.ballots_db.get(ballot_id)
 
+    @override
+    async def get_by_ids(self, ballot_ids: Iterable[str]) -> list[BallotTable]:
+        async with self._lock:
+            return [
+                self.ballots_db[bid] for bid in ballot_ids if bid in self.ballots_db
+            ]
+
     @override
     async def create_ballot_record(
         self,
@@ -112,6 +150,8 @@ class InMemoryBallotRepository(BallotRepository):
             )
 
             self.ballots_db[ballot_id] = ballot
+            if owner_id:
+                self.owners_db.setdefault(owner_id, []).append(ballot_id)
 
             ballot.options = []
             for opt_text in options:
@@ -131,31 +171,47 @@ class InMemoryBallotRepository(BallotRepository):
     @override
     async def add_vote(self, ballot_id: str, option_id: int) -> None:
         async with self._lock:
-            if ballot_id not in self.votes_db:
-                self.votes_db[ballot_id] = {}
-
-            self.votes_db[ballot_id][option_id] = (
-                self.votes_db[ballot_id].get(option_id, 0) + 1
-            )
+            self._insert_vote(ballot_id, option_id)
 
     @override
     async def add_write_in_option(self, ballot_id: str, encrypted_text: str) -> int:
         async with self._lock:
-            opt_id = self._opt_id_counter
-            self._opt_id_counter += 1
-
-            option = OptionTable(
-                id=opt_id,
-                ballot_id=ballot_id,
-                encrypted_text=encrypted_text,
-                is_write_in=True,
-            )
-
-            if ballot_id in self.ballots_db:
-                self.ballots_db[ballot_id].options.append(option)
+            return self._insert_write_in_option(ballot_id, encrypted_text)
 
+    @override
+    async def add_write_in_vote(self, ballot_id: str, encrypted_text: str) -> int:
+        # One critical section, so no reader sees the option without its vote
+        async with self._lock:
+            opt_id = self._insert_write_in_option(ballot_id, encrypted_text)
+            self._insert_vote(ballot_id, opt_id)
             return opt_id
 
+    def _insert_vote(self, ballot_id: str, option_id: int) -> None:
+        """Caller must hold self._lock."""
+        if ballot_id not in self.votes_db:
+            self.votes_db[ballot_id] = {}
+
+        self.votes_db[ballot_id][option_id] = (
+            self.votes_db[ballot_id].get(option_id, 0) + 1
+        )
+
+    def _insert_write_in_option(self, ballot_id: str, encrypted_text: str) -> int:
+        """Caller must hold self._lock."""
+        opt_id = self._opt_id_counter
+        self._opt_id_counter += 1
+
+        option = OptionTable(
+            id=opt_id,
+            ballot_id=ballot_id,
+            encrypted_text=encrypted_text,
+            is_write_in=True,
+        )
+
+        if ballot_id in self.ballots_db:
+            self.ballots_db[ballot_id].options.append(option)
+
+        return opt_id
+
     @override
     async def get_tallies(self, ballot_id: str) -> list[tuple[int, int]]:
         async with self._lock:
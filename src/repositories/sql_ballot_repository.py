@@ -1,7 +1,8 @@
+from collections.abc import Iterable
 from datetime import datetime
 from typing import override
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -25,16 +26,39 @@ class SqlBallotRepository(BallotRepository):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    @override
+    async def list_by_owner(self, owner_id: str) -> list[BallotTable]:
+        stmt = (
+            select(BallotTable)
+            .where(BallotTable.owner_id == owner_id)
+            .options(selectinload(BallotTable.options))
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     @override
     async def get_by_id(self, ballot_id: str) -> BallotTable | None:
         stmt = (
             select(BallotTable)
             .where(BallotTable.id == ballot_id)
             .options(selectinload(BallotTable.options))
+            # Sessions keep objects across commits, so refresh the options a
+            # concurrent write-in may have added since this row was loaded
+            .execution_options(populate_existing=True)
         )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    @override
+    async def get_by_ids(self, ballot_ids: Iterable[str]) -> list[BallotTable]:
+        stmt = (
+            select(BallotTable)
+            .where(BallotTable.id.in_(list(ballot_ids)))
+            .options(selectinload(BallotTable.options))
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     @override
     async def create_ballot_record(
         self,
@@ -90,6 +114,32 @@ class SqlBallotRepository(BallotRepository):
         await self.session.flush()
         return option.id
 
+    @override
+    async def add_write_in_vote(self, ballot_id: str, encrypted_text: str) -> int:
+        """
+        Inserts the option and its first vote in one statement (a data-modifying
+        CTE), so the write-in costs a single round trip plus the commit.
+        """
+        new_option = (
+            insert(OptionTable)
+            .values(
+                ballot_id=ballot_id, encrypted_text=encrypted_text, is_write_in=True
+            )
+            .returning(OptionTable.id)
+            .cte("new_option")
+        )
+        stmt = (
+            insert(VoteTable)
+            .from_select(
+                ["ballot_id", "option_id"],
+                select(literal(ballot_id), new_option.c.id),
+            )
+            .returning(VoteTable.option_id)
+        )
+        option_id = (await self.session.execute(stmt)).scalar_one()
+        await self.session.commit()
+        return option_id
+
     @override
     async def get_tallies(self, ballot_id: str) -> list[tuple[int, int]]:
         """Returns a list of (option_id, count)."""
@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, cast
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.responses import RedirectResponse
@@ -30,6 +30,19 @@ github_sso = GithubSSO(
     allow_insecure_http=True,
 )
 
+_UNRESOLVED = object()
+
+
+def _clear_cookie_header(key: str) -> str:
+    """The Set-Cookie value Starlette's delete_cookie would send for `key`."""
+    response = Response()
+    response.delete_cookie(key)
+    return response.headers["set-cookie"]
+
+
+# Logout always clears the same cookie, so the header value is built once.
+_CLEAR_SESSION_COOKIE = _clear_cookie_header("oponn_session")
+
 
 @router.get("/login/{provider}")
 async def login(provider: str):
@@ -105,12 +118,29 @@ async def callback(
 
 @router.get("/logout")
 async def logout():
-    response = RedirectResponse(url="/", status_code=303)
-    response.delete_cookie("oponn_session")
-    return response
+    return Response(
+        status_code=303,
+        headers={"location": "/", "set-cookie": _CLEAR_SESSION_COOKIE},
+    )
 
 
 def get_current_user_id(request: Request) -> str | None:
+    """
+    Resolves the signed-in user from the session cookie. The result is
+    memoized on request.state so repeated calls within a request are free.
+    """
+    cached = getattr(request.state, "user_id", _UNRESOLVED)
+    if cached is not _UNRESOLVED:
+        return cast(str | None, cached)
+
+    user_id = _resolve_user_id(request)
+    request.state.user_id = user_id
+    return user_id
+
+
+def _resolve_user_id(request: Request) -> str | None:
+    # Starlette's parse (last value wins, quotes removed) runs once per
+    # request and the result is memoized by get_current_user_id
     token = request.cookies.get("oponn_session")
     if not token:
         return None
@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from typing import Annotated, cast
 
 from fastapi import APIRouter, Depends
@@ -7,41 +7,60 @@ from jinja2 import Template
 from sse_starlette.sse import EventSourceResponse
 
 from ..dependencies import get_ballot_service, templates
+from ..models.ballot_models import Tally, tallies_adapter
 from ..services.ballot_service import BallotService
 
 router = APIRouter()
 
 
+async def _stream_tallies(
+    service: BallotService,
+    ballot_id: str,
+    render: Callable[[list[Tally]], str],
+) -> AsyncGenerator[dict[str, str], None]:
+    """Yields the initial tallies and every subsequent update as SSE events."""
+    feed = await service.register_sse_client(ballot_id)
+
+    try:
+        version = feed.version
+        initial_counts = await service.get_vote_counts(ballot_id)
+        yield {"data": render(initial_counts)}
+
+        while True:
+            # Wait for the next published tallies (the Redis listener is
+            # shared by the whole worker, not owned by this client)
+            version, updated_counts = await feed.wait(version)
+            yield {"data": render(updated_counts)}
+
+    except asyncio.CancelledError:
+        # Handle client disconnect
+        pass
+    finally:
+        await service.unregister_sse_client(ballot_id, feed)
+
+
 @router.get("/ballots/{ballot_id}/live-results")
 async def get_ballot_live_results(
     ballot_id: str, service: Annotated[BallotService, Depends(get_ballot_service)]
 ):
-    async def event_generator() -> AsyncGenerator[dict[str, str], None]:
-        queue = await service.register_sse_client(ballot_id)
-        template = cast(
-            Template,
-            templates.env.get_template("partials/vote_results.html"),
-        )
-
-        # Create a background task for listening to updates to avoid blocking the generator
-        listener_task = asyncio.create_task(
-            service.listen_for_updates(ballot_id, queue)
-        )
-
-        try:
-            initial_counts = await service.get_vote_counts(ballot_id)
-            yield {"data": str(template.render(results=initial_counts))}
-
-            while True:
-                # Wait for updates from the queue
-                updated_counts = await queue.get()
-                yield {"data": str(template.render(results=updated_counts))}
-
-        except asyncio.CancelledError:
-            # Handle client disconnect
-            pass
-        finally:
-            listener_task.cancel()
-            await service.unregister_sse_client(ballot_id, queue)
-
-    return EventSourceResponse(event_generator())
+    template = cast(
+        Template,
+        templates.env.get_template("partials/vote_results.html"),
+    )
+
+    def render(results: list[Tally]) -> str:
+        return str(template.render(results=results))
+
+    return EventSourceResponse(_stream_tallies(service, ballot_id, render))
+
+
+@router.get("/ballots/{ballot_id}/live-results.json")
+async def get_ballot_live_results_json(
+    ballot_id: str, service: Annotated[BallotService, Depends(get_ballot_service)]
+):
+    """Data-only feed for clients that render the tallies themselves."""
+
+    def render(results: list[Tally]) -> str:
+        return tallies_adapter.dump_json(results).decode()
+
+    return EventSourceResponse(_stream_tallies(service, ballot_id, render))
@@ -2,7 +2,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Form, Request, Response
 from fastapi.responses import HTMLResponse, RedirectResponse
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from ..dependencies import get_ballot_service, templates, validate_csrf
 from ..models.ballot_models import (
@@ -15,6 +15,10 @@ from .auth import get_current_user_id
 
 router = APIRouter()
 
+# Form validators built once at import and fed plain dicts per request
+_ballot_form_adapter = TypeAdapter(BallotCreateForm)
+_vote_form_adapter = TypeAdapter(VoteForm)
+
 
 def render_template(
     request: Request,
@@ -29,17 +33,13 @@ def render_template(
     if partial_name and request.headers.get("HX-Request"):
         template_name = partial_name
 
-    # Ensure CSRF token is always available in context if present in request state
+    # CSRFMiddleware sets the token on every HTTP request, so read it directly
     if "csrf_token" not in context:
-        context["csrf_token"] = getattr(request.state, "csrf_token", "")
+        context["csrf_token"] = request.state.csrf_token
 
     context["user_id"] = get_current_user_id(request)
 
-    return templates.TemplateResponse(
-        request=request,
-        name=template_name,
-        context=context,
-    )
+    return HTMLResponse(templates.get_template(template_name).render(context))
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -48,10 +48,7 @@ async def dashboard(
     service: Annotated[BallotService, Depends(get_ballot_service)],
 ):
     user_id = get_current_user_id(request)
-    ballots = []
-    if user_id:
-        all_ballots = await service.list_ballots()
-        ballots = [b for b in all_ballots if b.owner_id == user_id]
+    ballots = await service.list_ballots_by_owner(user_id) if user_id else []
 
     return render_template(
         request,
@@ -79,12 +76,21 @@ async def create_page(request: Request):
 
 
 @router.get("/partials/start-time-input", response_class=HTMLResponse)
-async def start_time_input(request: Request, start_time_type: str):
+async def start_time_input(start_time_type: str):
     if start_time_type == "scheduled":
-        return templates.TemplateResponse(
-            request=request, name="partials/start-time-input.html"
-        )
-    return HTMLResponse("")
+        # Rendered per request so template edits show up under auto_reload
+        template = templates.get_template("partials/start-time-input.html")
+        return HTMLResponse(template.render())
+    # Pre-encoded empty body: nothing to render or encode for the "now" case
+    return HTMLResponse(b"")
+
+
+def _render_create_error(
+    request: Request, form_fields: dict[str, object], **errors: object
+) -> Response:
+    """Re-renders the create form with sticky values; only built on failure."""
+    context: dict[str, object] = {"active_page": "create", **form_fields, **errors}
+    return render_template(request, "create.html", context, "partials/create_form.html")
 
 
 @router.post("/create", response_class=HTMLResponse)
@@ -99,9 +105,7 @@ async def process_create(
     scheduled_start_time: Annotated[str | None, Form()] = None,
     duration_mins: Annotated[int, Form()] = 0,
 ):
-    # Context shared between normal and error rendering
-    context: dict[str, object] = {
-        "active_page": "create",
+    form_fields: dict[str, object] = {
         "measure": measure,
         "options_raw": options_raw,
         "allow_write_in": allow_write_in,
@@ -112,14 +116,7 @@ async def process_create(
 
     try:
         # 1. Load the raw form data into our Form Model
-        form_data = BallotCreateForm(
-            measure=measure,
-            options_raw=options_raw,
-            allow_write_in=allow_write_in,
-            start_time_type=start_time_type,
-            scheduled_start_time=scheduled_start_time,
-            duration_mins=duration_mins,
-        )
+        form_data = _ballot_form_adapter.validate_python(form_fields)
         # 2. Convert to our core BallotCreate model (which does further domain validation)
         ballot_create = form_data.to_ballot_create()
 
@@ -127,25 +124,21 @@ async def process_create(
         error_msg, field_errors = format_pydantic_errors(
             e, field_mapping={"options": "options_raw"}
         )
-        context.update({"error": error_msg, "field_errors": field_errors})
-        return render_template(
-            request, "create.html", context, "partials/create_form.html"
+        return _render_create_error(
+            request, form_fields, error=error_msg, field_errors=field_errors
         )
 
     except Exception as e:
-        err_str = str(e).split("\n")[0]
-        context["error"] = err_str
-        return render_template(
-            request, "create.html", context, "partials/create_form.html"
-        )
+        return _render_create_error(request, form_fields, error=str(e).split("\n")[0])
 
     user_id = get_current_user_id(request)
     new_ballot = await service.create_ballot(ballot_create, owner_id=user_id)
 
     if request.headers.get("HX-Request"):
-        response = Response(status_code=204)
-        response.headers["HX-Redirect"] = f"/vote/{new_ballot.ballot_id}"
-        return response
+        return Response(
+            status_code=204,
+            headers={"HX-Redirect": f"/vote/{new_ballot.ballot_id}"},
+        )
 
     return RedirectResponse(url=f"/vote/{new_ballot.ballot_id}", status_code=303)
 
@@ -163,6 +156,15 @@ async def vote_page(
     )
 
 
+async def _render_vote_error(
+    request: Request, service: BallotService, ballot_id: str, **errors: object
+) -> Response:
+    """Re-renders the vote form; the ballot is only loaded on this failure path."""
+    ballot = await service.get_ballot(ballot_id)
+    context: dict[str, object] = {"ballot": ballot, **errors}
+    return render_template(request, "vote.html", context, "partials/vote_form.html")
+
+
 @router.post("/vote/{ballot_id}", response_class=HTMLResponse)
 async def process_vote(
     request: Request,
@@ -182,35 +184,40 @@ async def process_vote(
 
     try:
         # 1. Load the raw form data into our VoteForm model
-        form_data = VoteForm(option_id=option_id, write_in_value=write_in_value)
+        form_data = _vote_form_adapter.validate_python(
+            {"option_id": option_id, "write_in_value": write_in_value}
+        )
         # 2. Convert and validate to our core Vote model
         vote = form_data.to_vote()
 
-    except (ValidationError, ValueError, Exception) as e:
-        ballot = await service.get_ballot(ballot_id)
-        context: dict[str, object] = {"ballot": ballot}
-
-        if isinstance(e, ValidationError):
-            error_msg, field_errors = format_pydantic_errors(
-                e,
-                field_mapping={
-                    "option_id": "option_id",
-                    "write_in_value": "write_in_value",
-                },
+    except ValidationError as e:
+        error_msg, field_errors = format_pydantic_errors(
+            e,
+            field_mapping={
+                "option_id": "option_id",
+                "write_in_value": "write_in_value",
+            },
+        )
+        return await _render_vote_error(
+            request, service, ballot_id, error=error_msg, field_errors=field_errors
+        )
+
+    except ValueError as e:
+        if option_id == "__write_in__":
+            return await _render_vote_error(
+                request, service, ballot_id, field_errors={"write_in_value": str(e)}
             )
-            context.update({"error": error_msg, "field_errors": field_errors})
-        elif isinstance(e, ValueError) and option_id == "__write_in__":
-            context["field_errors"] = {"write_in_value": str(e)}
-        else:
-            context["error"] = str(e)
+        return await _render_vote_error(request, service, ballot_id, error=str(e))
 
-        return render_template(request, "vote.html", context, "partials/vote_form.html")
+    except Exception as e:
+        return await _render_vote_error(request, service, ballot_id, error=str(e))
 
     await service.record_vote(ballot_id, vote)
 
     if request.headers.get("HX-Request"):
-        response = Response(status_code=204)
-        response.headers["HX-Redirect"] = f"/results/{ballot_id}"
+        response = Response(
+            status_code=204, headers={"HX-Redirect": f"/results/{ballot_id}"}
+        )
         response.set_cookie(f"voted_{ballot_id}", "true", max_age=60 * 60 * 24 * 365)
         return response
 
@@ -225,8 +232,7 @@ async def results_page(
     ballot_id: str,
     service: Annotated[BallotService, Depends(get_ballot_service)],
 ):
-    ballot = await service.get_ballot(ballot_id)
-    results = await service.get_vote_counts(ballot_id)
+    ballot, results = await service.get_ballot_with_tallies(ballot_id)
     return render_template(
         request, "results.html", {"ballot": ballot, "results": results}
     )
@@ -1,11 +1,23 @@
 import asyncio
-import json
+import weakref
+from collections import deque
+from collections.abc import Awaitable
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 import structlog
 from redis import asyncio as aioredis
-
-from ..models.ballot_models import Ballot, BallotCreate, Tally, Vote
+from redis.asyncio.client import PubSub
+from tink import aead
+
+from ..models.ballot_models import (
+    Ballot,
+    BallotCreate,
+    Tally,
+    Vote,
+    as_utc,
+    tallies_adapter,
+)
 from ..models.exceptions import (
     BallotNotFoundError,
     InvalidOptionError,
@@ -14,30 +26,141 @@ from ..models.exceptions import (
 from ..repositories.ballot_repository import BallotRepository
 from ..repositories.models import BallotTable, generate_id
 from .crypto_service import CryptoService
+from .ttl_cache import TTLCache
 
 logger = structlog.stdlib.get_logger()
 
+# Votes landing within this window share one SSE/Redis broadcast
+_BROADCAST_DEBOUNCE_SECONDS = 0.05
+
+# Every ballot publishes on its own channel; one pattern covers them all
+_UPDATES_PATTERN = "ballot:*:updates"
+
+# Backoff bounds for resubscribing after the Redis listener loses its connection
+_LISTENER_RETRY_MIN_SECONDS = 0.5
+_LISTENER_RETRY_MAX_SECONDS = 30.0
+
+
+@lru_cache(maxsize=4096)
+def _format_minutes(minutes: int) -> str:
+    """Minute-granularity half of BallotService.format_time_delta."""
+    if minutes < 60:
+        return f"{minutes} minutes"
+    hours = minutes // 60
+    if hours < 24:
+        return f"{hours} hours"
+    days = hours // 24
+    return f"{days} days"
+
+
+def _snapshot_version(tallies: list[Tally]) -> int:
+    """
+    Number of votes a tally snapshot includes. Snapshots always list every
+    option that has a vote (see BallotService._tallies) and votes are only
+    ever added, so equal versions are equal counts and a larger one is newer.
+    """
+    return sum(t.count for t in tallies)
+
+
+class BallotFeed:
+    """
+    Latest tallies for a single ballot, shared by every SSE client watching it.
+    Only the newest counts are kept (a one-slot deque) and a single Condition
+    wakes all waiting clients, so no per-client queue is allocated. Clients
+    that fall behind simply read the latest value, coalescing bursts.
+    """
+
+    def __init__(self):
+        self.version: int = 0
+        self.subscribers: int = 0
+        self._latest: deque[list[Tally]] = deque(maxlen=1)
+        self._snapshot: int = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def latest(self) -> list[Tally]:
+        return self._latest[-1] if self._latest else []
+
+    async def publish(self, tallies: list[Tally]) -> None:
+        """Store the newest tallies and wake every waiting client."""
+        async with self._cond:
+            # An older snapshot lost the race to get here, and an equal one
+            # is a duplicate (e.g. this worker's own Redis echo); skip both
+            # so bursts collapse into one frame per distinct state.
+            snapshot = _snapshot_version(tallies)
+            if self._latest and snapshot <= self._snapshot:
+                return
+            self._snapshot = snapshot
+            self._latest.append(tallies)
+            self.version += 1
+            self._cond.notify_all()
+
+    async def wait(self, seen_version: int) -> tuple[int, list[Tally]]:
+        """Wait until a version newer than `seen_version` is published."""
+        async with self._cond:
+            _ = await self._cond.wait_for(lambda: self.version != seen_version)
+            return self.version, self.latest
+
 
 class BallotStateManager:
     """
     Singleton container for shared in-memory state.
-    Holds asyncio Locks and SSE Queues that must persist across requests.
+    Holds asyncio Locks and SSE feeds that must persist across requests.
     """
 
     def __init__(self):
-        self._sse_queues: dict[str, list[asyncio.Queue[list[Tally]]]] = {}
-        self._locks: dict[str, asyncio.Lock] = {}
+        self._feeds: dict[str, BallotFeed] = {}
+        # One Redis listener per worker, shared by every ballot's feed
+        self._listener: asyncio.Task[None] | None = None
+        # Weak values: a lock lives only while some vote holds or awaits it,
+        # so idle ballots do not accumulate locks in long-running workers.
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        # Newest unsent tallies per ballot; present while a flush is scheduled
+        self._pending_broadcasts: dict[str, list[Tally]] = {}
+        self._broadcast_tasks: set[asyncio.Task[None]] = set()
+        # Decrypted ballots keyed by (ballot_id, option count). Options are
+        # append-only, so a write-in from any worker changes the key.
+        self._ballot_cache: TTLCache[tuple[str, int], Ballot] = TTLCache(
+            maxsize=1024, ttl=30
+        )
 
     def get_lock(self, ballot_id: str) -> asyncio.Lock:
         """Get or create an asyncio.Lock for a specific ballot."""
-        if ballot_id not in self._locks:
-            self._locks[ballot_id] = asyncio.Lock()
-        return self._locks[ballot_id]
+        lock = self._locks.get(ballot_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[ballot_id] = lock
+        return lock
+
+    def get_feed(self, ballot_id: str) -> BallotFeed:
+        """Get or create the shared SSE feed for a specific ballot."""
+        if ballot_id not in self._feeds:
+            self._feeds[ballot_id] = BallotFeed()
+        return self._feeds[ballot_id]
 
     def clear(self):
         """Helper for testing to reset state."""
-        self._sse_queues.clear()
+        if self._listener:
+            _ = self._listener.cancel()
+            self._listener = None
+        for task in self._broadcast_tasks:
+            _ = task.cancel()
+        self._feeds.clear()
         self._locks.clear()
+        self._pending_broadcasts.clear()
+        self._broadcast_tasks.clear()
+        self._ballot_cache.clear()
+
+    async def aclose(self):
+        """Stops the Redis listener and pending broadcasts, waiting for both."""
+        tasks = list(self._broadcast_tasks)
+        if self._listener:
+            tasks.append(self._listener)
+        self.clear()
+        # Awaiting lets each task's cleanup (e.g. closing the pubsub) finish
+        _ = await asyncio.gather(*tasks, return_exceptions=True)
 
 
 class BallotService:
@@ -60,42 +183,58 @@ class BallotService:
 
     async def list_ballots(self) -> list[Ballot]:
         """Retrieve a list of all existing ballots."""
-        tables = await self.repository.list_all()
-        results = []
-        for t in tables:
-            results.append(await self._table_to_model(t))
-        return results
+        return await self._tables_to_models(await self.repository.list_all())
+
+    async def list_ballots_by_owner(self, owner_id: str) -> list[Ballot]:
+        """Retrieve the ballots owned by a specific user."""
+        tables = await self.repository.list_by_owner(owner_id)
+        return await self._tables_to_models(tables)
+
+    async def _tables_to_models(self, tables: list[BallotTable]) -> list[Ballot]:
+        """
+        Decrypt several rows concurrently. Only the crypto caches/KMS are
+        awaited here (never the DB session), so overlapping them is safe.
+        """
+        return list(await asyncio.gather(*(self._table_to_model(t) for t in tables)))
 
     async def _table_to_model(self, table: BallotTable) -> Ballot:
         """Helper to decrypt a table row into a domain model."""
-        keyset_handle = await self.crypto.get_ballot_keyset(
-            table.id, table.encrypted_dek
-        )
+        cache_key = (table.id, len(table.options))
+        cached = self.state._ballot_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        measure = self.crypto.decrypt_string(
-            table.encrypted_measure, keyset_handle, context="measure"
+        # One AEAD primitive (cached in L1) decrypts every field of the ballot
+        primitive = await self.crypto.get_ballot_aead(table.id, table.encrypted_dek)
+
+        measure = self.crypto.decrypt_with(
+            primitive, table.encrypted_measure, context="measure"
         )
 
         option_map = {}
         options_text = []
         for opt in table.options:
-            txt = self.crypto.decrypt_string(
-                opt.encrypted_text, keyset_handle, context="option"
+            txt = self.crypto.decrypt_with(
+                primitive, opt.encrypted_text, context="option"
             )
             option_map[opt.id] = txt
             if not opt.is_write_in:
                 options_text.append(txt)
 
-        return Ballot(
+        # Every field comes from our own row and decryption, so validation is
+        # skipped; the UTC normalization its validator would do is applied here.
+        ballot = Ballot.model_construct(
             ballot_id=table.id,
             owner_id=table.owner_id,
             measure=measure,
             options=options_text,
             option_map=option_map,
             allow_write_in=table.allow_write_in,
-            start_time=table.start_time,
-            end_time=table.end_time,
+            start_time=as_utc(table.start_time),
+            end_time=as_utc(table.end_time),
         )
+        self.state._ballot_cache.set(cache_key, ballot)
+        return ballot
 
     async def create_ballot(
         self, ballot_create: BallotCreate, owner_id: str | None = None
@@ -114,11 +253,12 @@ class BallotService:
             kms_key_id = self.crypto.provider.key_id
 
         enc_dek = await self.crypto.encrypt_ballot_keyset(keyset_handle, ballot_id)
-        enc_measure = self.crypto.encrypt_string(
-            ballot_create.measure, keyset_handle, context="measure"
+        primitive = keyset_handle.primitive(aead.Aead)
+        enc_measure = self.crypto.encrypt_with(
+            primitive, ballot_create.measure, context="measure"
         )
         enc_options = [
-            self.crypto.encrypt_string(opt, keyset_handle, context="option")
+            self.crypto.encrypt_with(primitive, opt, context="option")
             for opt in ballot_create.options
         ]
 
@@ -135,7 +275,7 @@ class BallotService:
             owner_id=owner_id,
         )
 
-        self.state._sse_queues[table.id] = []
+        _ = self.state.get_feed(table.id)
 
         logger.info(
             "ballot.created",
@@ -146,26 +286,40 @@ class BallotService:
 
     async def get_ballot(self, ballot_id: str) -> Ballot:
         """Retrieve a ballot by its ID. Raises BallotNotFoundError if not found."""
+        _, ballot = await self._load_ballot(ballot_id)
+        return ballot
+
+    async def _load_ballot(self, ballot_id: str) -> tuple[BallotTable, Ballot]:
+        """Fetch and decrypt a ballot, keeping the row for callers that write."""
         table = await self.repository.get_by_id(ballot_id)
         if not table:
             raise BallotNotFoundError(f"Ballot {ballot_id} not found")
-        return await self._table_to_model(table)
+        return table, await self._table_to_model(table)
 
     async def record_vote(self, ballot_id: str, vote: Vote) -> None:
         """
         Record a vote for a ballot and notify all workers via Redis.
-        Uses a Redis-backed distributed lock to ensure consistency across multiple workers.
+        Write-ins change the option set, so they take a Redis-backed
+        distributed lock; a vote for an existing option is a single insert
+        the database already serializes, so it runs without one.
         """
         lock_name = f"lock:ballot:{ballot_id}"
 
         try:
-            if self.redis:
+            if not vote.is_write_in:
+                option_map = await self._do_record_vote(ballot_id, vote)
+            elif self.redis:
                 # timeout=10 to prevent deadlocks if a worker crashes
                 async with self.redis.lock(lock_name, timeout=10):
-                    await self._do_record_vote(ballot_id, vote)
+                    option_map = await self._do_record_vote(ballot_id, vote)
             else:
                 async with self.state.get_lock(ballot_id):
-                    await self._do_record_vote(ballot_id, vote)
+                    option_map = await self._do_record_vote(ballot_id, vote)
+
+            # Tally outside the lock so the critical section ends at the
+            # write; the fan-out itself is debounced across concurrent votes.
+            updated_counts = await self._tallies(ballot_id, option_map)
+            self._schedule_broadcast(ballot_id, updated_counts)
 
             logger.info(
                 "vote.recorded",
@@ -176,9 +330,9 @@ class BallotService:
             logger.error("vote.failed", ballot_id=ballot_id, exc_info=True)
             raise
 
-    async def _do_record_vote(self, ballot_id: str, vote: Vote) -> None:
-        """Inner logic for recording a vote."""
-        ballot = await self.get_ballot(ballot_id)
+    async def _do_record_vote(self, ballot_id: str, vote: Vote) -> dict[int, str]:
+        """Inner logic for recording a vote. Returns the ballot's option map."""
+        table, ballot = await self._load_ballot(ballot_id)
         now = datetime.now(timezone.utc)
 
         if ballot.start_time and now < ballot.start_time:
@@ -194,145 +348,217 @@ class BallotService:
             if not vote.write_in_value:
                 raise InvalidOptionError("Write-in value is empty")
 
-            # Encrypt the write-in
-            table = await self.repository.get_by_id(ballot_id)
-            if not table:
-                raise BallotNotFoundError(ballot_id)
-            keyset_handle = await self.crypto.get_ballot_keyset(
-                table.id, table.encrypted_dek
-            )
+            # Reuse the row loaded above; its primitive is already in L1
+            primitive = await self.crypto.get_ballot_aead(table.id, table.encrypted_dek)
 
             # Encrypt write-in
-            enc_val = self.crypto.encrypt_string(
+            enc_val = self.crypto.encrypt_with(
+                primitive,
                 vote.write_in_value,
-                keyset_handle,
                 "option",
             )
 
-            # Add option and get ID
-            oid = await self.repository.add_write_in_option(ballot_id, enc_val)
-            await self.repository.add_vote(ballot_id, oid)
+            # Add the option and its vote together, returning the new ID
+            oid = await self.repository.add_write_in_vote(ballot_id, enc_val)
+            option_map = {**ballot.option_map, oid: vote.write_in_value}
         else:
             if vote.option_id not in ballot.option_map:
                 raise InvalidOptionError("Invalid option for this ballot")
             await self.repository.add_vote(ballot_id, vote.option_id)
+            option_map = ballot.option_map
+
+        # The ballot was validated above, so tallying can skip a re-fetch
+        return option_map
+
+    def _schedule_broadcast(self, ballot_id: str, updated_counts: list[Tally]) -> None:
+        """
+        Queue tallies for a debounced broadcast. Only the newest snapshot
+        pending for a ballot is sent when the window closes.
+        """
+        pending = self.state._pending_broadcasts
+        current = pending.get(ballot_id)
+        if current is not None:
+            # Tallies computed concurrently can finish out of order; keep the
+            # newest snapshot, which is complete and so safe to compare.
+            if _snapshot_version(updated_counts) > _snapshot_version(current):
+                pending[ballot_id] = updated_counts
+            return
 
-        # BROADCAST: Notify all workers via Redis Pub/Sub
-        updated_counts = await self.get_vote_counts(ballot_id)
+        pending[ballot_id] = updated_counts
+        # The flush only touches Redis and the shared feeds, never this
+        # request's DB session, so it may outlive the request.
+        task = asyncio.create_task(self._flush_broadcast(ballot_id))
+        self.state._broadcast_tasks.add(task)
+        task.add_done_callback(self.state._broadcast_tasks.discard)
+
+    async def _flush_broadcast(self, ballot_id: str) -> None:
+        """Send the newest pending tallies once the debounce window closes."""
+        await asyncio.sleep(_BROADCAST_DEBOUNCE_SECONDS)
+        updated_counts = self.state._pending_broadcasts.pop(ballot_id, None)
+        if updated_counts is not None:
+            await self._broadcast(ballot_id, updated_counts)
+
+    async def _broadcast(self, ballot_id: str, updated_counts: list[Tally]) -> None:
+        """Publish updated tallies to local SSE clients and other workers (Redis)."""
+        publishes: list[Awaitable[object]] = []
 
         # 1. Local update (for the worker that handled the request)
-        for queue in self.state._sse_queues.get(ballot_id, []):
-            await queue.put(updated_counts)
+        feed = self.state._feeds.get(ballot_id)
+        if feed:
+            publishes.append(feed.publish(updated_counts))
 
         # 2. Global update (for all other workers)
         if self.redis:
-            # Pydantic models need model_dump() for JSON serialization
-            data = json.dumps([t.model_dump() for t in updated_counts])
-            await self.redis.publish(f"ballot:{ballot_id}:updates", data)
+            data = tallies_adapter.dump_json(updated_counts)
+            publishes.append(self.redis.publish(f"ballot:{ballot_id}:updates", data))
+
+        for result in await asyncio.gather(*publishes, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "vote.broadcast_failed", ballot_id=ballot_id, error=str(result)
+                )
 
     async def get_vote_counts(self, ballot_id: str) -> list[Tally]:
         """Retrieve current vote counts for a ballot."""
         ballot = await self.get_ballot(ballot_id)
+        return await self._tallies(ballot_id, ballot.option_map)
 
-        tallies_raw = await self.repository.get_tallies(ballot_id)
-        counts_dict = {oid: count for oid, count in tallies_raw}
-
-        results = []
-        for oid, text in ballot.option_map.items():
-            results.append(Tally(option=text, count=counts_dict.get(oid, 0)))
+    async def get_ballot_with_tallies(
+        self, ballot_id: str
+    ) -> tuple[Ballot, list[Tally]]:
+        """Retrieve a ballot and its current vote counts with a single ballot load."""
+        ballot = await self.get_ballot(ballot_id)
+        return ballot, await self._tallies(ballot_id, ballot.option_map)
 
-        return results
+    async def _tallies(self, ballot_id: str, option_map: dict[int, str]) -> list[Tally]:
+        """
+        Build tallies for an already-loaded option map. A map loaded before a
+        concurrent write-in lacks that option, so the ballot is reloaded when
+        the counts name an option it does not know.
+        """
+        counts = dict(await self.repository.get_tallies(ballot_id))
+        if not counts.keys() <= option_map.keys():
+            option_map = (await self.get_ballot(ballot_id)).option_map
+
+        # Texts come from our own decryption and counts from the DB, so the
+        # models are built without re-running validation
+        return [
+            Tally.model_construct(option=text, count=counts.get(oid, 0))
+            for oid, text in option_map.items()
+        ]
 
-    async def register_sse_client(self, ballot_id: str) -> asyncio.Queue[list[Tally]]:
-        """Register a new SSE client for a ballot and return its event queue."""
+    async def register_sse_client(self, ballot_id: str) -> BallotFeed:
+        """
+        Register a new SSE client for a ballot and return the shared feed.
+        Interest is tracked locally; the first client on this worker starts
+        (or restarts) the shared Redis listener.
+        """
         _ = await self.get_ballot(ballot_id)
-        queue: asyncio.Queue[list[Tally]] = asyncio.Queue()
-        if ballot_id not in self.state._sse_queues:
-            self.state._sse_queues[ballot_id] = []
-        self.state._sse_queues[ballot_id].append(queue)
-        return queue
-
-    async def unregister_sse_client(
-        self, ballot_id: str, queue: asyncio.Queue[list[Tally]]
-    ):
-        """Remove an SSE client's queue from a ballot's notification list."""
-        if ballot_id in self.state._sse_queues:
-            try:
-                self.state._sse_queues[ballot_id].remove(queue)
-            except ValueError:
-                pass
+        feed = self.state.get_feed(ballot_id)
+        feed.subscribers += 1
+        listener = self.state._listener
+        if self.redis and (listener is None or listener.done()):
+            self.state._listener = asyncio.create_task(self.listen_for_updates())
+        return feed
+
+    async def unregister_sse_client(self, ballot_id: str, feed: BallotFeed):
+        """Release an SSE client's hold on a ballot feed."""
+        feed.subscribers = max(0, feed.subscribers - 1)
+        if feed.subscribers:
+            return
 
-        if (
-            ballot_id in self.state._sse_queues
-            and not self.state._sse_queues[ballot_id]
-        ):
-            del self.state._sse_queues[ballot_id]
+        if self.state._feeds.get(ballot_id) is feed:
+            del self.state._feeds[ballot_id]
 
     async def cleanup_stale_metadata(self):
         """
-        Identify and remove metadata (locks, queue lists) for expired ballots.
+        Identify and remove metadata (locks, feeds) for expired ballots.
         """
         lock_ids = set(self.state._locks.keys())
-        queue_ids = set(self.state._sse_queues.keys())
-        all_ids = lock_ids.union(queue_ids)
+        feed_ids = set(self.state._feeds.keys())
+        all_ids = lock_ids.union(feed_ids)
+        if not all_ids:
+            return
+
+        # One query for every tracked ballot; status only needs the
+        # plaintext timestamps, so nothing is decrypted here.
+        tables = {t.id: t for t in await self.repository.get_by_ids(all_ids)}
 
         cleaned_count = 0
 
         for ballot_id in all_ids:
-            try:
-                ballot = await self.get_ballot(ballot_id)
-                status, _ = self.get_status(ballot)
-
-                if status == "ended":
-                    if (
-                        ballot_id in self.state._sse_queues
-                        and not self.state._sse_queues[ballot_id]
-                    ):
-                        del self.state._sse_queues[ballot_id]
-                        cleaned_count += 1
-
-                    if ballot_id in self.state._locks:
-                        del self.state._locks[ballot_id]
-                        cleaned_count += 1
-
-            except BallotNotFoundError:
-                _ = self.state._sse_queues.pop(ballot_id, None)
+            table = tables.get(ballot_id)
+            if table is None:
+                _ = self.state._feeds.pop(ballot_id, None)
                 _ = self.state._locks.pop(ballot_id, None)
                 cleaned_count += 1
+                continue
+
+            status, _ = self.get_status_for(
+                as_utc(table.start_time), as_utc(table.end_time)
+            )
+            if status != "ended":
+                continue
+
+            feed = self.state._feeds.get(ballot_id)
+            if feed and not feed.subscribers:
+                del self.state._feeds[ballot_id]
+                cleaned_count += 1
+
+            if self.state._locks.pop(ballot_id, None) is not None:
+                cleaned_count += 1
 
         if cleaned_count > 0:
             logger.info("metadata.cleanup", cleaned_items=cleaned_count)
 
-    async def listen_for_updates(
-        self, ballot_id: str, queue: asyncio.Queue[list[Tally]]
-    ):
+    async def listen_for_updates(self):
         """
-        Listen to Redis Pub/Sub for updates to a specific ballot and push them to the local queue.
+        Listen to Redis Pub/Sub for updates to every ballot over a single
+        connection and publish them to the matching local feed, if any.
+        Connection failures are logged and the subscription is retried with
+        exponential backoff, so one Redis outage does not end live updates.
         """
         if not self.redis:
             return
 
-        pubsub = self.redis.pubsub()
-        channel = f"ballot:{ballot_id}:updates"
-        await pubsub.subscribe(channel)
-
-        logger.debug("sse.redis_subscribe", ballot_id=ballot_id, channel=channel)
+        delay = _LISTENER_RETRY_MIN_SECONDS
+        while True:
+            pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(_UPDATES_PATTERN)
+                logger.debug("sse.redis_subscribe", pattern=_UPDATES_PATTERN)
+                delay = _LISTENER_RETRY_MIN_SECONDS
+                await self._relay_updates(pubsub)
+            except Exception:
+                logger.warning("sse.listener_failed", retry_in=delay, exc_info=True)
+            finally:
+                # Closing drops the connection and with it the subscription
+                await pubsub.aclose()
+                logger.debug("sse.redis_unsubscribe", pattern=_UPDATES_PATTERN)
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _LISTENER_RETRY_MAX_SECONDS)
+
+    async def _relay_updates(self, pubsub: PubSub) -> None:
+        """Forward pattern messages from a subscribed pubsub to local feeds."""
+        while True:
+            message = await pubsub.get_message(timeout=1.0)
+            if message is None or message["type"] != "pmessage":
+                continue
+
+            # Channel and data are bytes because decode_responses=False
+            ballot_id = message["channel"].decode().split(":")[1]
+            feed = self.state._feeds.get(ballot_id)
+            if feed is None:
+                continue
 
-        try:
-            async for message in pubsub.listen():
-                if message["type"] == "message":
-                    # message["data"] is bytes because decode_responses=False
-                    raw_data = message["data"]
-                    if isinstance(raw_data, bytes):
-                        data = json.loads(raw_data.decode("utf-8"))
-                    else:
-                        data = json.loads(raw_data)
-                    tallies = [Tally(**t) for t in data]
-                    await queue.put(tallies)
-        finally:
-            await pubsub.unsubscribe(channel)
-            await pubsub.aclose()
-            logger.debug("sse.redis_unsubscribe", ballot_id=ballot_id)
+            try:
+                tallies = tallies_adapter.validate_json(message["data"])
+            except ValueError:
+                # One bad payload must not stop updates for every ballot
+                logger.warning("sse.invalid_update", ballot_id=ballot_id)
+                continue
+            await feed.publish(tallies)
 
     @staticmethod
     def format_time_delta(diff: timedelta) -> str:
@@ -340,14 +566,8 @@ class BallotService:
         seconds = int(diff.total_seconds())
         if seconds < 60:
             return f"{seconds} seconds"
-        minutes = seconds // 60
-        if minutes < 60:
-            return f"{minutes} minutes"
-        hours = minutes // 60
-        if hours < 24:
-            return f"{hours} hours"
-        days = hours // 24
-        return f"{days} days"
+        # Above a minute the text only changes per minute, so memoize on that
+        return _format_minutes(seconds // 60)
 
     @staticmethod
     def get_status(ballot: Ballot) -> tuple[str, str]:
@@ -355,15 +575,16 @@ class BallotService:
         Determine the current status of a ballot based on the current time.
         Returns a tuple of (status_class, status_text).
         """
-        now = datetime.now(timezone.utc)
-
-        st = ballot.start_time
-        if st and st.tzinfo is None:
-            st = st.replace(tzinfo=timezone.utc)
+        # Ballot normalizes naive start/end times to UTC on construction
+        return BallotService.get_status_for(ballot.start_time, ballot.end_time)
 
-        et = ballot.end_time
-        if et and et.tzinfo is None:
-            et = et.replace(tzinfo=timezone.utc)
+    @staticmethod
+    def get_status_for(st: datetime | None, et: datetime | None) -> tuple[str, str]:
+        """
+        Status from UTC-aware start/end times alone, for callers holding a raw
+        row: the times are stored in plaintext, so no decryption is needed.
+        """
+        now = datetime.now(timezone.utc)
 
         if st and now < st:
             return "pending", f"starts in {BallotService.format_time_delta(st - now)}"
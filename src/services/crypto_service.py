@@ -1,18 +1,27 @@
+import asyncio
 import base64
-import io
-import time
 
+import structlog
 from redis import asyncio as aioredis
 from tink import (
     BinaryKeysetReader,
-    BinaryKeysetWriter,
     KeysetHandle,
     aead,
     cleartext_keyset_handle,
     new_keyset_handle,
 )
 
-from .kms_provider import MasterKeyProvider
+from .kms_provider import MasterKeyProvider, serialize_keyset
+from .ttl_cache import TTLCache
+
+logger = structlog.stdlib.get_logger()
+
+# Ballot IDs published here are dropped from every worker's L1 cache
+_INVALIDATE_CHANNEL = "dek:invalidate"
+
+# Backoff bounds for resubscribing after the listener loses its connection
+_LISTENER_RETRY_MIN_SECONDS = 0.5
+_LISTENER_RETRY_MAX_SECONDS = 30.0
 
 
 class CryptoService:
@@ -23,52 +32,99 @@ class CryptoService:
     """
 
     redis: aioredis.Redis | None
-    _l1_cache: dict[str, tuple[KeysetHandle, float]]
+    _l1_cache: TTLCache[str, tuple[KeysetHandle, aead.Aead]]
     _l1_ttl: int
+    _inflight: dict[str, asyncio.Task[tuple[KeysetHandle, aead.Aead]]]
+    _invalidation_listener: asyncio.Task[None] | None
     provider: MasterKeyProvider
 
     def __init__(
         self,
         provider: MasterKeyProvider,
         redis_client: aioredis.Redis | None = None,
+        l1_maxsize: int = 2048,
     ):
         aead.register()
         self.redis = redis_client
         self.provider = provider
 
-        # L1 Cache: ballot_id -> (keyset_handle, expiry)
-        self._l1_cache = {}
+        # L1 Cache: ballot_id -> (keyset_handle, aead_primitive), LRU-bounded.
+        # The TTL bounds how long decrypted keys live in process memory; an
+        # expiry costs one L2 read and keyset parse, which is cheap enough.
         self._l1_ttl = 60  # 1 minute
+        self._l1_cache = TTLCache(maxsize=l1_maxsize, ttl=self._l1_ttl)
+
+        # In-flight L1 misses: ballot_id -> shared load future
+        self._inflight = {}
+
+        # Started on first lookup; evicts L1 entries invalidated elsewhere
+        self._invalidation_listener = None
 
     async def get_ballot_keyset(
         self, ballot_id: str, encrypted_dek: str | None = None
     ) -> KeysetHandle:
         """Retrieves a decrypted keyset, checking L1 and L2 caches before hitting the KMS."""
-        now = time.time()
+        handle, _ = await self._get_ballot_entry(ballot_id, encrypted_dek)
+        return handle
+
+    async def get_ballot_aead(
+        self, ballot_id: str, encrypted_dek: str | None = None
+    ) -> aead.Aead:
+        """Like get_ballot_keyset, but returns the cached AEAD primitive."""
+        _, primitive = await self._get_ballot_entry(ballot_id, encrypted_dek)
+        return primitive
+
+    async def _get_ballot_entry(
+        self, ballot_id: str, encrypted_dek: str | None
+    ) -> tuple[KeysetHandle, aead.Aead]:
+        self._ensure_invalidation_listener()
 
         # 1. Check L1
-        if ballot_id in self._l1_cache:
-            handle, expiry = self._l1_cache[ballot_id]
-            if now < expiry:
-                return handle
-            del self._l1_cache[ballot_id]
+        entry = self._l1_cache.get(ballot_id)
+        if entry is not None:
+            return entry
 
+        # L1 miss: concurrent callers for the same ballot share one L2/KMS load.
+        # shield() keeps a cancelled waiter from cancelling the shared load.
+        load = self._inflight.get(ballot_id)
+        if load is None:
+            load = asyncio.create_task(
+                self._load_ballot_entry(ballot_id, encrypted_dek)
+            )
+            self._inflight[ballot_id] = load
+            load.add_done_callback(lambda done: self._forget_load(ballot_id, done))
+        return await asyncio.shield(load)
+
+    def _forget_load(
+        self, ballot_id: str, load: asyncio.Task[tuple[KeysetHandle, aead.Aead]]
+    ) -> None:
+        # An invalidation may already have replaced or dropped this load
+        if self._inflight.get(ballot_id) is load:
+            del self._inflight[ballot_id]
+
+    def _is_current_load(self, ballot_id: str) -> bool:
+        """False once an invalidation has dropped the running load's entry."""
+        return self._inflight.get(ballot_id) is asyncio.current_task()
+
+    async def _load_ballot_entry(
+        self, ballot_id: str, encrypted_dek: str | None
+    ) -> tuple[KeysetHandle, aead.Aead]:
+        """Loads a keyset from L2 or the KMS and populates the caches."""
         # 2. Check L2 (Redis)
-        l2_key = f"dek:ballot:{ballot_id}"
+        l2_key = self._l2_key(ballot_id)
         if self.redis:
-            serialized_keyset_b64 = await self.redis.get(l2_key)
-            if serialized_keyset_b64:
-                # Sliding window: refresh TTL
-                await self.redis.expire(l2_key, 600)  # 10 minutes
-
-                raw_bytes = base64.b64decode(serialized_keyset_b64)
+            # Sliding window: GETEX reads and refreshes the TTL in one round trip
+            raw_bytes = await self.redis.getex(l2_key, ex=600)  # 10 minutes
+            if raw_bytes:
                 reader = BinaryKeysetReader(raw_bytes)
                 # Note: This keyset in Redis is ALREADY decrypted (the "pass")
                 handle = cleartext_keyset_handle.read(reader)
+                primitive = handle.primitive(aead.Aead)
 
-                # Populate L1
-                self._l1_cache[ballot_id] = (handle, now + self._l1_ttl)
-                return handle
+                # Populate L1, unless the keyset was invalidated meanwhile
+                if self._is_current_load(ballot_id):
+                    self._l1_cache.set(ballot_id, (handle, primitive))
+                return handle, primitive
 
         # 3. Cache Miss: Decrypt using Master Key (The "KMS" call)
         if not encrypted_dek:
@@ -77,19 +133,94 @@ class CryptoService:
             )
 
         handle = await self.decrypt_ballot_keyset(encrypted_dek, ballot_id)
+        primitive = handle.primitive(aead.Aead)
 
-        # 4. Populate Caches
-        self._l1_cache[ballot_id] = (handle, now + self._l1_ttl)
+        # 4. Populate Caches, unless the keyset was invalidated meanwhile
+        if not self._is_current_load(ballot_id):
+            return handle, primitive
+        self._l1_cache.set(ballot_id, (handle, primitive))
         if self.redis:
             # Serialize the decrypted keyset for Redis
-            out = io.BytesIO()
-            writer = BinaryKeysetWriter(out)
-            cleartext_keyset_handle.write(writer, handle)
-            await self.redis.setex(
-                l2_key, 600, base64.b64encode(out.getvalue()).decode()
+            raw_bytes = serialize_keyset(handle)
+            await self.redis.setex(l2_key, 600, raw_bytes)
+
+        return handle, primitive
+
+    @staticmethod
+    def _l2_key(ballot_id: str) -> str:
+        # Raw keyset bytes (the client does not decode responses); the "v2"
+        # prefix keeps older base64-encoded entries from being misread.
+        return f"dek:v2:ballot:{ballot_id}"
+
+    async def invalidate(self, ballot_id: str) -> None:
+        """
+        Drops a ballot's keyset from L2 and from the L1 cache of every worker,
+        for callers that change or revoke the key.
+        """
+        self._evict(ballot_id)
+        if self.redis:
+            _ = await self.redis.delete(self._l2_key(ballot_id))
+            _ = await self.redis.publish(_INVALIDATE_CHANNEL, ballot_id)
+
+    def _evict(self, ballot_id: str) -> None:
+        # Dropping the in-flight entry keeps a load that started before the
+        # invalidation from putting the old keyset back into the caches
+        self._l1_cache.pop(ballot_id)
+        _ = self._inflight.pop(ballot_id, None)
+
+    def _ensure_invalidation_listener(self) -> None:
+        """(Re)starts the invalidation listener, e.g. after a dropped connection."""
+        listener = self._invalidation_listener
+        if self.redis and (listener is None or listener.done()):
+            self._invalidation_listener = asyncio.create_task(
+                self._listen_for_invalidations()
             )
 
-        return handle
+    async def _listen_for_invalidations(self) -> None:
+        """Evicts ballots published on the invalidation channel, resubscribing
+        with exponential backoff if the connection drops."""
+        if not self.redis:
+            return
+
+        delay = _LISTENER_RETRY_MIN_SECONDS
+        while True:
+            pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(_INVALIDATE_CHANNEL)
+                delay = _LISTENER_RETRY_MIN_SECONDS
+                while True:
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message is not None and message["type"] == "message":
+                        self._evict(message["data"].decode())
+            except Exception:
+                logger.warning(
+                    "crypto.invalidation_listener_failed",
+                    retry_in=delay,
+                    exc_info=True,
+                )
+            finally:
+                # Closing drops the connection and with it the subscription
+                await pubsub.aclose()
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _LISTENER_RETRY_MAX_SECONDS)
+
+    def reset_caches(self) -> None:
+        """Empties the in-process keyset cache (L2 in Redis is left alone)."""
+        self._l1_cache.clear()
+
+    async def aclose(self) -> None:
+        """Stops the invalidation listener and releases the provider."""
+        listener = self._invalidation_listener
+        if listener:
+            self._invalidation_listener = None
+            _ = listener.cancel()
+            # Waiting lets the listener close its pubsub connection first
+            try:
+                await listener
+            except asyncio.CancelledError:
+                pass
+        await self.provider.aclose()
 
     def generate_ballot_keyset(self) -> KeysetHandle:
         """Generates a new unique keyset for a ballot."""
@@ -99,27 +230,42 @@ class CryptoService:
         self, keyset_handle: KeysetHandle, ballot_id: str
     ) -> str:
         """Encrypts a ballot keyset using the Master Provider (KEK)."""
-        return await self.provider.encrypt_dek(keyset_handle, ballot_id)
+        # Providers exchange raw bytes; base64 is only for the text DB column
+        encrypted = await self.provider.encrypt_dek(keyset_handle, ballot_id)
+        return base64.b64encode(encrypted).decode()
 
     async def decrypt_ballot_keyset(
         self, encrypted_keyset_b64: str, ballot_id: str
     ) -> KeysetHandle:
         """Decrypts a ballot keyset using the Master Provider (KEK)."""
-        return await self.provider.decrypt_dek(encrypted_keyset_b64, ballot_id)
+        encrypted = base64.b64decode(encrypted_keyset_b64)
+        return await self.provider.decrypt_dek(encrypted, ballot_id)
 
     def encrypt_string(
         self, plaintext: str, keyset_handle: KeysetHandle, context: str = ""
     ) -> str:
         """Encrypts a string using the provided ballot keyset."""
-        primitive = keyset_handle.primitive(aead.Aead)
-        ciphertext = primitive.encrypt(plaintext.encode(), context.encode())
-        return base64.b64encode(ciphertext).decode()
+        return self.encrypt_with(keyset_handle.primitive(aead.Aead), plaintext, context)
 
     def decrypt_string(
         self, ciphertext_b64: str, keyset_handle: KeysetHandle, context: str = ""
     ) -> str:
         """Decrypts a string using the provided ballot keyset."""
-        primitive = keyset_handle.primitive(aead.Aead)
+        return self.decrypt_with(
+            keyset_handle.primitive(aead.Aead), ciphertext_b64, context
+        )
+
+    def encrypt_with(
+        self, primitive: aead.Aead, plaintext: str, context: str = ""
+    ) -> str:
+        """Encrypts a string with an already-built AEAD primitive."""
+        ciphertext = primitive.encrypt(plaintext.encode(), context.encode())
+        return base64.b64encode(ciphertext).decode()
+
+    def decrypt_with(
+        self, primitive: aead.Aead, ciphertext_b64: str, context: str = ""
+    ) -> str:
+        """Decrypts a string with an already-built AEAD primitive."""
         raw_ciphertext = base64.b64decode(ciphertext_b64)
         plaintext = primitive.decrypt(raw_ciphertext, context.encode())
         return plaintext.decode()
@@ -1,30 +1,55 @@
 import abc
-import base64
-import io
+import asyncio
+from contextlib import AsyncExitStack
 from typing import Any
 
 import aioboto3
+from botocore.config import Config
 from tink import (
     BinaryKeysetReader,
-    BinaryKeysetWriter,
     KeysetHandle,
+    KeysetWriter,
     aead,
     cleartext_keyset_handle,
     new_keyset_handle,
 )
+from tink.proto import tink_pb2
+
+
+class _BytesKeysetWriter(KeysetWriter):
+    """Captures the serialized keyset directly, with no intermediate stream."""
+
+    value: bytes = b""
+
+    def write(self, keyset: tink_pb2.Keyset) -> None:
+        self.value = keyset.SerializeToString()
+
+    def write_encrypted(self, encrypted_keyset: tink_pb2.EncryptedKeyset) -> None:
+        self.value = encrypted_keyset.SerializeToString()
+
+
+def serialize_keyset(handle: KeysetHandle) -> bytes:
+    """Serializes a cleartext keyset to Tink's binary format."""
+    writer = _BytesKeysetWriter()
+    cleartext_keyset_handle.write(writer, handle)
+    return writer.value
 
 
 class MasterKeyProvider(abc.ABC):
     """Abstract interface for Master Key operations (KEK)."""
 
     @abc.abstractmethod
-    async def encrypt_dek(self, dek_handle: KeysetHandle, ballot_id: str) -> str:
-        """Encrypts a Tink KeysetHandle (DEK) and returns a base64 string."""
+    async def encrypt_dek(self, dek_handle: KeysetHandle, ballot_id: str) -> bytes:
+        """Encrypts a Tink KeysetHandle (DEK) and returns the raw ciphertext."""
         pass
 
     @abc.abstractmethod
-    async def decrypt_dek(self, encrypted_dek_b64: str, ballot_id: str) -> KeysetHandle:
-        """Decrypts a base64 string into a Tink KeysetHandle (DEK)."""
+    async def decrypt_dek(self, encrypted_dek: bytes, ballot_id: str) -> KeysetHandle:
+        """Decrypts raw ciphertext into a Tink KeysetHandle (DEK)."""
+        pass
+
+    async def aclose(self) -> None:
+        """Releases any long-lived connections held by the provider."""
         pass
 
 
@@ -42,22 +67,16 @@ class LocalMasterKeyProvider(MasterKeyProvider):
         self.keyset_handle = new_keyset_handle(aead.aead_key_templates.AES128_GCM)
         self.aead = self.keyset_handle.primitive(aead.Aead)
 
-    async def encrypt_dek(self, dek_handle: KeysetHandle, ballot_id: str) -> str:
+    async def encrypt_dek(self, dek_handle: KeysetHandle, ballot_id: str) -> bytes:
         # 1. Serialize DEK to binary
-        out = io.BytesIO()
-        writer = BinaryKeysetWriter(out)
-        cleartext_keyset_handle.write(writer, dek_handle)
-        plaintext_dek = out.getvalue()
+        plaintext_dek = serialize_keyset(dek_handle)
 
         # 2. Encrypt using local AEAD (including context as associated data)
-        ciphertext = self.aead.encrypt(plaintext_dek, ballot_id.encode())
-        return base64.b64encode(ciphertext).decode()
-
-    async def decrypt_dek(self, encrypted_dek_b64: str, ballot_id: str) -> KeysetHandle:
-        ciphertext = base64.b64decode(encrypted_dek_b64)
+        return self.aead.encrypt(plaintext_dek, ballot_id.encode())
 
+    async def decrypt_dek(self, encrypted_dek: bytes, ballot_id: str) -> KeysetHandle:
         # 1. Decrypt using local AEAD
-        plaintext_dek = self.aead.decrypt(ciphertext, ballot_id.encode())
+        plaintext_dek = self.aead.decrypt(encrypted_dek, ballot_id.encode())
 
         # 2. Deserialize to Tink handle
         reader = BinaryKeysetReader(plaintext_dek)
@@ -98,9 +117,24 @@ class AwsKmsMasterKeyProvider(MasterKeyProvider):
 
         self.session = aioboto3.Session(**session_kwargs)
 
+        # One KMS client per provider, opened lazily and kept for the process
+        # lifetime so calls reuse a warm keep-alive connection
+        self._client_args = self._get_client_args()
+        self._kms_client: Any = None
+        self._exit_stack: AsyncExitStack | None = None
+        self._client_lock = asyncio.Lock()
+
     def _get_client_args(self) -> dict[str, Any]:
         args: dict[str, Any] = {
             "region_name": self.region,
+            # The shared client fans out concurrent cache misses, so lift the
+            # default 10-connection ceiling; adaptive retries back off on
+            # throttling instead of retrying a burst in lockstep.
+            "config": Config(
+                max_pool_connections=64,
+                retries={"mode": "adaptive", "max_attempts": 5},
+                tcp_keepalive=True,
+            ),
         }
 
         if not self.endpoint_url:
@@ -117,32 +151,45 @@ class AwsKmsMasterKeyProvider(MasterKeyProvider):
         args["verify"] = False
         return args
 
-    async def encrypt_dek(self, dek_handle: KeysetHandle, ballot_id: str) -> str:
+    async def _client(self) -> Any:
+        """Returns the shared KMS client, opening it on first use."""
+        if self._kms_client is None:
+            async with self._client_lock:
+                if self._kms_client is None:
+                    stack = AsyncExitStack()
+                    self._kms_client = await stack.enter_async_context(
+                        self.session.client("kms", **self._client_args)  # type: ignore
+                    )
+                    self._exit_stack = stack
+        return self._kms_client
+
+    async def aclose(self) -> None:
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+            self._kms_client = None
+
+    async def encrypt_dek(self, dek_handle: KeysetHandle, ballot_id: str) -> bytes:
         # 1. Serialize DEK to binary
-        out = io.BytesIO()
-        writer = BinaryKeysetWriter(out)
-        cleartext_keyset_handle.write(writer, dek_handle)
-        plaintext_dek = out.getvalue()
+        plaintext_dek = serialize_keyset(dek_handle)
 
         # 2. Encrypt via AWS KMS
-        async with self.session.client("kms", **self._get_client_args()) as kms:  # type: ignore
-            response = await kms.encrypt(
-                KeyId=self.key_id,
-                Plaintext=plaintext_dek,
-                EncryptionContext={"ballot_id": ballot_id},
-            )
-            return base64.b64encode(response["CiphertextBlob"]).decode()
-
-    async def decrypt_dek(self, encrypted_dek_b64: str, ballot_id: str) -> KeysetHandle:
-        ciphertext = base64.b64decode(encrypted_dek_b64)
-
+        kms = await self._client()
+        response = await kms.encrypt(
+            KeyId=self.key_id,
+            Plaintext=plaintext_dek,
+            EncryptionContext={"ballot_id": ballot_id},
+        )
+        return response["CiphertextBlob"]
+
+    async def decrypt_dek(self, encrypted_dek: bytes, ballot_id: str) -> KeysetHandle:
         # 1. Decrypt via AWS KMS
-        async with self.session.client("kms", **self._get_client_args()) as kms:  # type: ignore
-            response = await kms.decrypt(
-                CiphertextBlob=ciphertext,
-                EncryptionContext={"ballot_id": ballot_id},
-            )
-            plaintext_dek = response["Plaintext"]
+        kms = await self._client()
+        response = await kms.decrypt(
+            CiphertextBlob=encrypted_dek,
+            EncryptionContext={"ballot_id": ballot_id},
+        )
+        plaintext_dek = response["Plaintext"]
 
         # 2. Deserialize to Tink handle
         reader = BinaryKeysetReader(plaintext_dek)
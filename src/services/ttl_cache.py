@@ -0,0 +1,52 @@
+import time
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded in-process cache with least-recently-used eviction and a fixed TTL.
+    Both eviction and expiry are O(1): entries expire when read, and the
+    oldest entry is dropped once `maxsize` is exceeded.
+    """
+
+    _entries: OrderedDict[K, tuple[V, float]]
+    maxsize: int
+    ttl: float
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._entries = OrderedDict()
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    def get(self, key: K) -> V | None:
+        """Returns the live value for `key`, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expiry = entry
+        if time.monotonic() >= expiry:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Stores `value`, evicting the least recently used entry if full."""
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            _ = self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Removes `key` if present."""
+        _ = self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
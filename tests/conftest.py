@@ -8,13 +8,15 @@ os.environ["OPONN_SKIP_CSRF"] = "true"
 import socket
 import threading
 import time
-from typing import AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncGenerator, Generator
 
 import pytest
 import pytest_asyncio
 import uvicorn
-from httpx import ASGITransport, AsyncClient
+from httpx import ASGITransport, AsyncClient, AsyncHTTPTransport
 from src.dependencies import (
+    get_ballot_service,
     get_ballot_state_manager,
     get_in_memory_ballot_repo,
     get_crypto_service,
@@ -45,11 +47,18 @@ def fix_url_for_docker(url: str) -> str:
 @pytest.fixture(scope="session", autouse=True)
 def infra_containers():
     """Starts Postgres, Redis, and LocalStack containers for the entire test session."""
-    with (
-        PostgresContainer("postgres:16-alpine") as postgres,
-        RedisContainer("redis:7-alpine") as redis,
-        LocalStackContainer("localstack/localstack:latest") as localstack,
-    ):
+    postgres = PostgresContainer("postgres:16-alpine")
+    redis = RedisContainer("redis:7-alpine")
+    localstack = LocalStackContainer("localstack/localstack:latest")
+    containers = (postgres, redis, localstack)
+
+    # Start all three at once so startup costs the slowest container, not the sum
+    with ThreadPoolExecutor(max_workers=len(containers)) as pool:
+        startups = [pool.submit(c.start) for c in containers]
+    try:
+        for startup in startups:
+            _ = startup.result()
+
         # Get connection URLs
         db_url = fix_url_for_docker(
             postgres.get_connection_url().replace("psycopg2", "asyncpg")
@@ -98,6 +107,24 @@ def infra_containers():
             "db_url": db_url,
             "redis_url": redis_url,
         }
+    finally:
+        started = [
+            c for c, startup in zip(containers, startups) if not startup.exception()
+        ]
+        with ThreadPoolExecutor(max_workers=len(containers)) as pool:
+            _ = list(pool.map(lambda c: c.stop(), started))
+
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:  # pragma: no cover
+    BeautifulSoup = None
+
+# Failure dumps go under the project's working directory
+_FAILURE_DIR = os.path.join(os.getcwd(), ".pytest_failures")
+
+# Prettifying very large documents costs more than it helps
+_PRETTIFY_MAX_CHARS = 200_000
 
 
 def pytest_assertrepr_compare(op: str, left: object, right: object) -> list[str] | None:
@@ -108,21 +135,14 @@ def pytest_assertrepr_compare(op: str, left: object, right: object) -> list[str]
         and op == "in"
         and "<html" in right.lower()
     ):
-        try:
-            from bs4 import BeautifulSoup
-
-            # Prettify the HTML for easier reading
+        # Prettify the HTML for easier reading
+        right_pretty = right
+        if BeautifulSoup is not None and len(right) < _PRETTIFY_MAX_CHARS:
             right_pretty = BeautifulSoup(right, "html.parser").prettify()
-        except ImportError:
-            right_pretty = right
 
         # Write to a temp file for full inspection
-        import os
-
-        # Use the project's temp dir if we can identify it, otherwise system temp
-        temp_dir = os.path.join(os.getcwd(), ".pytest_failures")
-        os.makedirs(temp_dir, exist_ok=True)
-        dump_path = os.path.join(temp_dir, "failure_output.html")
+        os.makedirs(_FAILURE_DIR, exist_ok=True)
+        dump_path = os.path.join(_FAILURE_DIR, "failure_output.html")
         with open(dump_path, "w") as f:
             f.write(right)
 
@@ -136,31 +156,36 @@ def pytest_assertrepr_compare(op: str, left: object, right: object) -> list[str]
         return lines
 
 
-def get_free_port():
-    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    s.bind(("", 0))
-    port = s.getsockname()[1]
-    s.close()
-    return port
+def make_listen_socket() -> socket.socket:
+    """
+    Binds a listening socket on an ephemeral port. Handing the socket itself to
+    the server (rather than just its port number) means the port is never
+    released in between, so another process cannot grab it.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen()
+    return sock
 
 
 @pytest_asyncio.fixture(autouse=True)
 async def reset_service():
     """Resets the global service state before each test to ensure isolation."""
+    # Drop per-test overrides (the session-wide CSRF override stays)
+    app.dependency_overrides.pop(get_ballot_service, None)
+
     # Reset shared State Manager
     state = await get_ballot_state_manager()
     state.clear()
 
     # Reset Crypto Cache
     crypto = await get_crypto_service()
-    crypto._l1_cache.clear()
+    crypto.reset_caches()
 
     # Reset in-memory repo
     repo = await get_in_memory_ballot_repo()
-    repo.ballots_db.clear()
-    repo.votes_db.clear()
-    repo.options_db.clear()
-    repo._opt_id_counter = 1
+    repo.reset()
 
     # Reset SQL Database if using it
     if os.getenv("DATABASE_URL"):
@@ -168,20 +193,30 @@ async def reset_service():
 
         engine = get_engine()
         async with engine.begin() as conn:
-            # Disable foreign key checks temporarily to truncate all tables
-            await conn.execute(text("TRUNCATE ballots, options, votes, users CASCADE"))
+            # Tables only hold a handful of rows per test, so DELETE (children
+            # first) is cheaper than TRUNCATE, which rewrites relation files
+            for table in ("votes", "options", "ballots", "users"):
+                await conn.execute(text(f"DELETE FROM {table}"))
 
 
-@pytest_asyncio.fixture
-async def client() -> AsyncGenerator[AsyncClient, None]:
-    # Override CSRF for local TestClient tests
+@pytest.fixture(scope="session")
+def asgi_transport() -> Generator[ASGITransport, None, None]:
+    """One in-process transport (and CSRF override) shared by the whole session."""
     app.dependency_overrides[validate_csrf] = lambda: None
+    yield ASGITransport(app=app)
+    _ = app.dependency_overrides.pop(validate_csrf, None)
 
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
 
-    app.dependency_overrides.clear()
+@pytest_asyncio.fixture
+async def client(asgi_transport: ASGITransport) -> AsyncGenerator[AsyncClient, None]:
+    # The client itself stays per-test so each test starts with an empty
+    # cookie jar
+    async with AsyncClient(
+        transport=asgi_transport,
+        base_url="http://test",
+        headers={"X-CSRF-Token": "test-token"},
+    ) as c:
+        yield c
 
 
 @pytest.fixture(scope="session")
@@ -190,27 +225,52 @@ def server_url(infra_containers):
     # Disable CSRF for the background server during tests
     os.environ["OPONN_SKIP_CSRF"] = "true"
 
-    port = get_free_port()
-    config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="error")
+    sock = make_listen_socket()
+    port = sock.getsockname()[1]
+    # loop/http default to "auto", which already picks uvloop and httptools
+    # when installed (and falls back to asyncio/h11 elsewhere)
+    config = uvicorn.Config(
+        app,
+        host="127.0.0.1",
+        port=port,
+        log_level="error",
+        access_log=False,
+        timeout_keep_alive=75,
+    )
     server = uvicorn.Server(config)
-    thread = threading.Thread(target=server.run)
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]})
     thread.daemon = True
     thread.start()
 
-    # Wait for server to start
+    # Wait for server to start: uvicorn sets `started` once lifespan startup
+    # has run and the socket is listening
     url = f"http://127.0.0.1:{port}"
-    start_time = time.time()
-    while time.time() - start_time < 5:
-        try:
-            with socket.create_connection(("127.0.0.1", port), timeout=0.1):
-                break
-        except (OSError, ConnectionRefusedError):
-            time.sleep(0.1)
-    else:
-        pytest.fail("Server failed to start in background")
+    deadline = time.monotonic() + 5
+    while not server.started:
+        if time.monotonic() > deadline or not thread.is_alive():
+            pytest.fail("Server failed to start in background")
+        time.sleep(0.005)
 
     yield url
 
     server.should_exit = True
     thread.join(timeout=2)
+    sock.close()
     os.environ.pop("OPONN_SKIP_CSRF", None)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_transport(server_url: str) -> AsyncGenerator[AsyncHTTPTransport, None]:
+    """One keep-alive connection pool to the background server for the session."""
+    transport = AsyncHTTPTransport()
+    yield transport
+    await transport.aclose()
+
+
+@pytest_asyncio.fixture
+async def http_client(
+    server_url: str, http_transport: AsyncHTTPTransport
+) -> AsyncGenerator[AsyncClient, None]:
+    # Per-test client (fresh cookie jar) over the shared pool. It is not
+    # closed here: closing a client also closes its transport.
+    yield AsyncClient(transport=http_transport, base_url=server_url, timeout=10.0)
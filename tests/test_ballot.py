@@ -8,6 +8,11 @@ from src.dependencies import get_ballot_service
 from src.main import app
 from src.models.ballot_models import Ballot, BallotCreate
 
+# Session cookie for "user-123", signed once for the module
+_USER_123_TOKEN = URLSafeTimedSerializer(
+    "dev_secret_key_change_in_prod", salt="oponn-auth"
+).dumps("user-123")
+
 
 async def test_dashboard_with_mocked_service(client: AsyncClient):
     # Setup mock service
@@ -20,12 +25,10 @@ async def test_dashboard_with_mocked_service(client: AsyncClient):
         allow_write_in=False,
         start_time=datetime.now(timezone.utc),
     )
-    mock_service.list_ballots.return_value = [mock_ballot]
+    mock_service.list_ballots_by_owner.return_value = [mock_ballot]
 
     # Simulate Login
-    signer = URLSafeTimedSerializer("dev_secret_key_change_in_prod", salt="oponn-auth")
-    token = signer.dumps("user-123")
-    client.cookies.set("oponn_session", token)
+    client.cookies.set("oponn_session", _USER_123_TOKEN)
 
     # Override dependency
     app.dependency_overrides[get_ballot_service] = lambda: mock_service
@@ -35,7 +38,7 @@ async def test_dashboard_with_mocked_service(client: AsyncClient):
         assert response.status_code == 200
         assert "Mocked Ballot" in response.text
         assert "my_ballots" in response.text
-        mock_service.list_ballots.assert_called_once()
+        mock_service.list_ballots_by_owner.assert_called_once_with("user-123")
     finally:
         # Clean up override
         app.dependency_overrides.pop(get_ballot_service)
@@ -21,9 +21,8 @@ async def test_concurrent_voting_consistency():
         measure="Concurrent Test", options=["Option A", "Option B"], allow_write_in=True
     )
     ballot = await service.create_ballot(bc)
-    option_a_id = [oid for oid, txt in ballot.option_map.items() if txt == "Option A"][
-        0
-    ]
+    by_text = {txt: oid for oid, txt in ballot.option_map.items()}
+    option_a_id = by_text["Option A"]
 
     num_users = 50
     votes_per_user = 20
@@ -60,8 +59,9 @@ async def test_high_concurrency_mixed_options():
         measure="Mixed Concurrent", options=["A", "B"], allow_write_in=True
     )
     ballot = await service.create_ballot(bc)
-    option_a_id = [oid for oid, txt in ballot.option_map.items() if txt == "A"][0]
-    option_b_id = [oid for oid, txt in ballot.option_map.items() if txt == "B"][0]
+    by_text = {txt: oid for oid, txt in ballot.option_map.items()}
+    option_a_id = by_text["A"]
+    option_b_id = by_text["B"]
 
     num_tasks = 100
 
@@ -76,16 +76,16 @@ async def test_high_concurrency_mixed_options():
             ballot.ballot_id, Vote(write_in_value=f"WriteIn_{i}", is_write_in=True)
         )
 
-    tasks = []
-    for i in range(num_tasks):
-        if i % 3 == 0:
-            tasks.append(vote_a())
-        elif i % 3 == 1:
-            tasks.append(vote_b())
-        else:
-            tasks.append(vote_write_in(i))
-
-    await asyncio.gather(*tasks)
+    # A TaskGroup cancels the remaining votes as soon as one fails, rather
+    # than letting them run on after the test has already errored
+    async with asyncio.TaskGroup() as tg:
+        for i in range(num_tasks):
+            if i % 3 == 0:
+                _ = tg.create_task(vote_a())
+            elif i % 3 == 1:
+                _ = tg.create_task(vote_b())
+            else:
+                _ = tg.create_task(vote_write_in(i))
 
     tallies = await service.get_vote_counts(ballot.ballot_id)
     total_votes = sum(t.count for t in tallies)
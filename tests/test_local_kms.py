@@ -1,20 +1,32 @@
+import asyncio
+
 import pytest
-from src.services.kms_provider import LocalMasterKeyProvider
-from tink import KeysetHandle, TinkError, new_keyset_handle
+from src.dependencies import get_redis_client
+from src.services.crypto_service import _INVALIDATE_CHANNEL, CryptoService
+from src.services.kms_provider import LocalMasterKeyProvider, serialize_keyset
+from tink import (
+    BinaryKeysetReader,
+    KeysetHandle,
+    TinkError,
+    cleartext_keyset_handle,
+    new_keyset_handle,
+)
 from tink.aead import Aead, aead_key_templates
 
 
-@pytest.mark.asyncio
-async def test_local_master_key_provider():
+@pytest.fixture(scope="module")
+def dek_handle() -> KeysetHandle:
+    """A DEK shared by the provider tests; handles are immutable."""
+    return new_keyset_handle(aead_key_templates.AES128_GCM)
+
+
+async def test_local_master_key_provider(dek_handle: KeysetHandle):
     provider = LocalMasterKeyProvider()
     ballot_id = "test_ballot"
 
-    # Generate a DEK
-    dek_handle = new_keyset_handle(aead_key_templates.AES128_GCM)
-
     # Encrypt DEK
     encrypted_dek = await provider.encrypt_dek(dek_handle, ballot_id)
-    assert isinstance(encrypted_dek, str)
+    assert isinstance(encrypted_dek, bytes)
     assert len(encrypted_dek) > 0
 
     # Decrypt DEK
@@ -32,13 +44,156 @@ async def test_local_master_key_provider():
     assert decrypted_aead.decrypt(ciphertext, context) == plaintext
 
 
-@pytest.mark.asyncio
-async def test_local_master_key_provider_wrong_context():
+async def test_local_master_key_provider_wrong_context(dek_handle: KeysetHandle):
     provider = LocalMasterKeyProvider()
     ballot_id = "test_ballot"
-    dek_handle = new_keyset_handle(aead_key_templates.AES128_GCM)
 
     encrypted_dek = await provider.encrypt_dek(dek_handle, ballot_id)
 
     with pytest.raises(TinkError):
         await provider.decrypt_dek(encrypted_dek, "wrong_ballot_id")
+
+
+async def test_crypto_service_coalesces_concurrent_keyset_loads():
+    provider = LocalMasterKeyProvider()
+    crypto = CryptoService(provider=provider)
+    ballot_id = "coalesced_ballot"
+    encrypted_dek = await crypto.encrypt_ballot_keyset(
+        new_keyset_handle(aead_key_templates.AES256_GCM), ballot_id
+    )
+
+    calls = 0
+    original_decrypt = provider.decrypt_dek
+
+    async def counting_decrypt(dek: bytes, bid: str) -> KeysetHandle:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return await original_decrypt(dek, bid)
+
+    provider.decrypt_dek = counting_decrypt
+
+    handles = await asyncio.gather(
+        *(crypto.get_ballot_keyset(ballot_id, encrypted_dek) for _ in range(10))
+    )
+
+    assert calls == 1
+    assert all(h is handles[0] for h in handles)
+
+
+async def test_crypto_service_invalidate_drops_cached_keyset():
+    provider = LocalMasterKeyProvider()
+    crypto = CryptoService(provider=provider)
+    ballot_id = "invalidated_ballot"
+    encrypted_dek = await crypto.encrypt_ballot_keyset(
+        new_keyset_handle(aead_key_templates.AES256_GCM), ballot_id
+    )
+
+    first = await crypto.get_ballot_keyset(ballot_id, encrypted_dek)
+    assert await crypto.get_ballot_keyset(ballot_id) is first
+
+    await crypto.invalidate(ballot_id)
+
+    # The next lookup must go back to the KMS, so the DEK is required again
+    with pytest.raises(ValueError):
+        await crypto.get_ballot_keyset(ballot_id)
+
+
+async def test_crypto_service_invalidate_discards_inflight_load():
+    provider = LocalMasterKeyProvider()
+    crypto = CryptoService(provider=provider)
+    ballot_id = "inflight_ballot"
+    encrypted_dek = await crypto.encrypt_ballot_keyset(
+        new_keyset_handle(aead_key_templates.AES256_GCM), ballot_id
+    )
+
+    original_decrypt = provider.decrypt_dek
+
+    async def slow_decrypt(dek: bytes, bid: str) -> KeysetHandle:
+        await asyncio.sleep(0.01)
+        return await original_decrypt(dek, bid)
+
+    provider.decrypt_dek = slow_decrypt
+
+    lookup = asyncio.create_task(crypto.get_ballot_keyset(ballot_id, encrypted_dek))
+    await asyncio.sleep(0)
+    await crypto.invalidate(ballot_id)
+    _ = await lookup
+
+    # The load predates the invalidation, so it must not repopulate L1
+    with pytest.raises(ValueError):
+        await crypto.get_ballot_keyset(ballot_id)
+
+
+async def test_crypto_service_invalidate_reaches_other_workers():
+    redis = await get_redis_client()
+    if not redis:
+        pytest.skip("Redis not available")
+
+    async def channel_subscribers() -> int:
+        [(_, count)] = await redis.pubsub_numsub(_INVALIDATE_CHANNEL)
+        return count
+
+    publisher = CryptoService(provider=LocalMasterKeyProvider(), redis_client=redis)
+    subscriber = CryptoService(provider=LocalMasterKeyProvider(), redis_client=redis)
+    ballot_id = "broadcast_invalidated_ballot"
+    encrypted_dek = await publisher.encrypt_ballot_keyset(
+        new_keyset_handle(aead_key_templates.AES256_GCM), ballot_id
+    )
+
+    try:
+        # The first lookup also starts the subscriber's listener; wait until
+        # Redis reports it subscribed so the invalidation cannot be missed
+        subscribed_before = await channel_subscribers()
+        _ = await subscriber.get_ballot_keyset(ballot_id, encrypted_dek)
+        for _ in range(100):
+            if await channel_subscribers() > subscribed_before:
+                break
+            await asyncio.sleep(0.05)
+        assert await channel_subscribers() > subscribed_before
+
+        await publisher.invalidate(ballot_id)
+
+        for _ in range(20):
+            if subscriber._l1_cache.get(ballot_id) is None:
+                break
+            await asyncio.sleep(0.05)
+        assert subscriber._l1_cache.get(ballot_id) is None
+    finally:
+        await publisher.aclose()
+        await subscriber.aclose()
+
+
+async def test_crypto_service_reads_l2_after_l1_expiry():
+    redis = await get_redis_client()
+    if not redis:
+        pytest.skip("Redis not available")
+
+    crypto = CryptoService(provider=LocalMasterKeyProvider(), redis_client=redis)
+    # Every L1 entry is already expired when read back
+    crypto._l1_cache.ttl = 0
+    ballot_id = "l2_ballot"
+    _ = await redis.delete(crypto._l2_key(ballot_id))
+    encrypted_dek = await crypto.encrypt_ballot_keyset(
+        new_keyset_handle(aead_key_templates.AES256_GCM), ballot_id
+    )
+
+    try:
+        first = await crypto.get_ballot_keyset(ballot_id, encrypted_dek)
+
+        # No DEK is passed, so this can only be served by L2
+        second = await crypto.get_ballot_keyset(ballot_id)
+        assert second is not first
+        assert serialize_keyset(second) == serialize_keyset(first)
+    finally:
+        _ = await redis.delete(crypto._l2_key(ballot_id))
+        await crypto.aclose()
+
+
+def test_serialize_keyset_round_trips():
+    handle = new_keyset_handle(aead_key_templates.AES256_GCM)
+    reader = BinaryKeysetReader(serialize_keyset(handle))
+    restored = cleartext_keyset_handle.read(reader)
+
+    ciphertext = handle.primitive(Aead).encrypt(b"payload", b"ctx")
+    assert restored.primitive(Aead).decrypt(ciphertext, b"ctx") == b"payload"
@@ -1,20 +1,17 @@
 import pytest_asyncio
 import secrets
-import os
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database import get_sessionmaker
 from src.repositories.sql_ballot_repository import SqlBallotRepository
 from src.services.crypto_service import CryptoService
 
 
 @pytest_asyncio.fixture
 async def db_session():
-    db_url = os.getenv("DATABASE_URL")
-    assert db_url is not None, "DATABASE_URL must be set"
-    engine = create_async_engine(db_url)
-    Session = async_sessionmaker(bind=engine, expire_on_commit=False)
-    async with Session() as session:
+    # The app's engine lives for the whole session loop, so each test only
+    # checks a pooled connection out instead of building and disposing a pool
+    async with get_sessionmaker()() as session:
         yield session
-    await engine.dispose()
 
 
 @pytest_asyncio.fixture
@@ -105,3 +102,76 @@ async def test_add_vote_and_tally(
 
     assert tally_dict[opt_1_id] == 1
     assert tally_dict[write_in_id] == 1
+
+
+async def test_list_by_owner(
+    db_session: AsyncSession,
+    repository: SqlBallotRepository,
+    crypto: CryptoService,
+):
+    from src.repositories.sql_user_repository import SqlUserRepository
+
+    owner = await SqlUserRepository(db_session).create(
+        f"{secrets.token_hex(4)}@example.com", "google", secrets.token_hex(8)
+    )
+
+    owned_ids = []
+    for owner_id in (owner.id, None):
+        ballot_id = secrets.token_urlsafe(16)
+        keyset = crypto.generate_ballot_keyset()
+        await repository.create_ballot_record(
+            ballot_id=ballot_id,
+            encrypted_measure=crypto.encrypt_string("Owned", keyset, context="measure"),
+            encrypted_dek=await crypto.encrypt_ballot_keyset(keyset, ballot_id),
+            options=[],
+            allow_write_in=False,
+            start_time=None,
+            end_time=None,
+            owner_id=owner_id,
+        )
+        if owner_id:
+            owned_ids.append(ballot_id)
+
+    ballots = await repository.list_by_owner(owner.id)
+    assert [b.id for b in ballots] == owned_ids
+
+
+async def test_get_by_ids(repository: SqlBallotRepository, crypto: CryptoService):
+    created_ids = []
+    for _ in range(2):
+        ballot_id = secrets.token_urlsafe(16)
+        keyset = crypto.generate_ballot_keyset()
+        await repository.create_ballot_record(
+            ballot_id=ballot_id,
+            encrypted_measure=crypto.encrypt_string("Batch", keyset, context="measure"),
+            encrypted_dek=await crypto.encrypt_ballot_keyset(keyset, ballot_id),
+            options=[],
+            allow_write_in=False,
+            start_time=None,
+            end_time=None,
+        )
+        created_ids.append(ballot_id)
+
+    ballots = await repository.get_by_ids([*created_ids, "missing"])
+    assert sorted(b.id for b in ballots) == sorted(created_ids)
+
+
+async def test_add_write_in_vote(
+    repository: SqlBallotRepository, crypto: CryptoService
+):
+    ballot_id = secrets.token_urlsafe(16)
+    keyset = crypto.generate_ballot_keyset()
+    _ = await repository.create_ballot_record(
+        ballot_id=ballot_id,
+        encrypted_measure=crypto.encrypt_string("Write-in", keyset, context="measure"),
+        encrypted_dek=await crypto.encrypt_ballot_keyset(keyset, ballot_id),
+        options=[crypto.encrypt_string("Opt 1", keyset, context="option")],
+        allow_write_in=True,
+        start_time=None,
+        end_time=None,
+    )
+
+    enc_write_in = crypto.encrypt_string("Mine", keyset, context="option")
+    write_in_id = await repository.add_write_in_vote(ballot_id, enc_write_in)
+
+    assert (write_in_id, 1) in await repository.get_tallies(ballot_id)
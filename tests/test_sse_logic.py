@@ -7,13 +7,12 @@ from src.dependencies import (
     get_crypto_service,
     get_in_memory_ballot_repo,
 )
-from src.services.ballot_service import BallotService, Tally
+from src.services.ballot_service import BallotFeed, BallotService, Tally
 
 
-@pytest.mark.asyncio
 async def test_ballot_service_redis_listener_logic():
     """
-    Unit test for the logic that bridges Redis Pub/Sub to local SSE queues.
+    Unit test for the logic that bridges Redis Pub/Sub to local SSE feeds.
     This specifically verifies the fix for JSON serialization/deserialization.
     """
     redis = await get_redis_client()
@@ -26,10 +25,10 @@ async def test_ballot_service_redis_listener_logic():
     service = BallotService(repo, crypto, state, redis)
 
     ballot_id = "test_logic_id"
-    queue = asyncio.Queue()
+    feed = state.get_feed(ballot_id)
 
-    # Manually start the listener in the background
-    listener_task = asyncio.create_task(service.listen_for_updates(ballot_id, queue))
+    # Manually start the shared listener in the background
+    listener_task = asyncio.create_task(service.listen_for_updates())
 
     try:
         # Give it a moment to subscribe
@@ -39,9 +38,9 @@ async def test_ballot_service_redis_listener_logic():
         test_data = [Tally(option="Yes", count=10).model_dump()]
         await redis.publish(f"ballot:{ballot_id}:updates", json.dumps(test_data))
 
-        # Check if the queue received the parsed Tally objects
+        # Check if the feed received the parsed Tally objects
         try:
-            received_tallies = await asyncio.wait_for(queue.get(), timeout=2.0)
+            _, received_tallies = await asyncio.wait_for(feed.wait(0), timeout=2.0)
             assert len(received_tallies) == 1
             assert received_tallies[0].option == "Yes"
             assert received_tallies[0].count == 10
@@ -52,3 +51,87 @@ async def test_ballot_service_redis_listener_logic():
 
     finally:
         listener_task.cancel()
+
+
+async def test_ballot_feed_wakes_every_subscriber():
+    """A single publish must reach every client waiting on the same feed."""
+    feed = BallotFeed()
+
+    waiters = [asyncio.create_task(feed.wait(feed.version)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    await feed.publish([Tally(option="Yes", count=1)])
+
+    results = await asyncio.wait_for(asyncio.gather(*waiters), timeout=1.0)
+    assert all(version == 1 for version, _ in results)
+    assert all(tallies[0].count == 1 for _, tallies in results)
+
+
+async def test_ballot_feed_ignores_stale_snapshot():
+    """Tallies published out of order must not roll the feed back."""
+    feed = BallotFeed()
+
+    await feed.publish([Tally(option="Yes", count=2)])
+    await feed.publish([Tally(option="Yes", count=1)])
+
+    assert feed.version == 1
+    assert feed.latest[0].count == 2
+
+
+async def test_ballot_feed_coalesces_duplicate_snapshot():
+    """The local publish and its Redis echo must produce a single update."""
+    feed = BallotFeed()
+
+    tallies = [Tally(option="Yes", count=1)]
+    await feed.publish(tallies)
+    await feed.publish([Tally(option="Yes", count=1)])
+
+    assert feed.version == 1
+
+
+async def test_tallies_include_concurrent_write_in():
+    """A snapshot built from a stale option map must still list the write-in."""
+    from src.models.ballot_models import BallotCreate, Vote
+
+    state = await get_ballot_state_manager()
+    crypto = await get_crypto_service()
+    repo = await get_in_memory_ballot_repo()
+    service = BallotService(repo, crypto, state)
+
+    ballot = await service.create_ballot(
+        BallotCreate(measure="Stale", options=["A", "B"], allow_write_in=True)
+    )
+    stale_map = dict(ballot.option_map)
+    await service.record_vote(
+        ballot.ballot_id, Vote(is_write_in=True, write_in_value="C")
+    )
+
+    tallies = await service._tallies(ballot.ballot_id, stale_map)
+
+    assert [(t.option, t.count) for t in tallies] == [("A", 0), ("B", 0), ("C", 1)]
+
+
+async def test_vote_burst_coalesces_into_one_broadcast():
+    """Votes landing inside the debounce window share a single feed update."""
+    from src.models.ballot_models import BallotCreate, Vote
+
+    state = await get_ballot_state_manager()
+    crypto = await get_crypto_service()
+    repo = await get_in_memory_ballot_repo()
+    service = BallotService(repo, crypto, state)
+
+    ballot = await service.create_ballot(
+        BallotCreate(measure="Burst", options=["A", "B"], allow_write_in=False)
+    )
+    option_id = next(iter(ballot.option_map))
+    feed = await service.register_sse_client(ballot.ballot_id)
+
+    vote = Vote(option_id=option_id)
+    _ = await asyncio.gather(
+        *(service.record_vote(ballot.ballot_id, vote) for _ in range(10))
+    )
+    version, tallies = await asyncio.wait_for(feed.wait(0), timeout=1.0)
+
+    assert version == 1
+    assert sum(t.count for t in tallies) == 10
+    await service.unregister_sse_client(ballot.ballot_id, feed)
@@ -1,5 +1,11 @@
-from datetime import timedelta
-from src.services.ballot_service import BallotService
+import gc
+from datetime import datetime, timedelta, timezone
+
+from src.dependencies import get_ballot_state_manager, get_crypto_service
+from src.models.ballot_models import Ballot, BallotCreate, Vote
+from src.repositories.ballot_repository import InMemoryBallotRepository
+from src.services.ballot_service import BallotService, BallotStateManager
+from src.services.ttl_cache import TTLCache
 
 
 def test_format_time_delta():
@@ -18,3 +24,96 @@ def test_format_time_delta():
     assert BallotService.format_time_delta(timedelta(days=2)) == "2 days"
     assert BallotService.format_time_delta(timedelta(hours=47)) == "1 days"
     assert BallotService.format_time_delta(timedelta(days=10)) == "10 days"
+
+
+def test_state_manager_drops_idle_locks():
+    state = BallotStateManager()
+    lock = state.get_lock("ballot-1")
+    assert state.get_lock("ballot-1") is lock
+
+    del lock
+    _ = gc.collect()
+    assert "ballot-1" not in state._locks
+
+
+def test_ballot_normalizes_naive_times_to_utc():
+    ballot = Ballot(
+        ballot_id="b",
+        measure="Naive",
+        options=["A", "B"],
+        allow_write_in=False,
+        start_time=datetime(2030, 1, 1, 12, 0),
+    )
+    assert ballot.start_time == datetime(2030, 1, 1, 12, 0, tzinfo=timezone.utc)
+    assert BallotService.get_status(ballot)[0] == "pending"
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" is now most recently used
+
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expires_entries():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_get_status_for_raw_times():
+    now = datetime.now(timezone.utc)
+    hour = timedelta(hours=1)
+    ended = BallotService.get_status_for(now - 2 * hour, now - hour)
+    pending = BallotService.get_status_for(now + hour, None)
+
+    assert ended == ("ended", "voting closed")
+    assert pending[0] == "pending"
+    assert BallotService.get_status_for(None, None) == ("active", "voting open")
+
+
+async def test_decrypted_ballot_cache_follows_write_ins():
+    repo = InMemoryBallotRepository()
+    crypto = await get_crypto_service()
+    state = await get_ballot_state_manager()
+    service = BallotService(repo, crypto=crypto, state_manager=state)
+
+    bc = BallotCreate(measure="Cached Ballot", options=["A", "B"], allow_write_in=True)
+    ballot = await service.create_ballot(bc)
+
+    # Repeat loads reuse the decrypted model
+    first = await service.get_ballot(ballot.ballot_id)
+    assert await service.get_ballot(ballot.ballot_id) is first
+
+    # A write-in adds an option, so the next load sees it
+    await service.record_vote(
+        ballot.ballot_id, Vote(write_in_value="C", is_write_in=True)
+    )
+    updated = await service.get_ballot(ballot.ballot_id)
+    assert "C" in updated.option_map.values()
+
+
+async def test_constructed_ballot_matches_validated_model():
+    """Guards the unvalidated Ballot construction against field drift."""
+    repo = InMemoryBallotRepository()
+    crypto = await get_crypto_service()
+    state = await get_ballot_state_manager()
+    service = BallotService(repo, crypto=crypto, state_manager=state)
+
+    bc = BallotCreate(
+        measure="Trusted Build",
+        options=["A", "B"],
+        allow_write_in=False,
+        start_time=datetime(2030, 1, 1),
+    )
+    ballot = await service.create_ballot(bc)
+
+    dumped = ballot.model_dump()
+    assert Ballot.model_validate(dumped).model_dump() == dumped
+    assert ballot.start_time is not None and ballot.start_time.tzinfo is not None
@@ -1,74 +1,43 @@
+import pytest
 from httpx import AsyncClient
 
+_VALID_FORM = {
+    "measure": "Test Ballot",
+    "options_raw": "A\nB",
+    "allow_write_in": False,
+    "start_time_type": "now",
+}
 
-async def test_measure_length_validation(client: AsyncClient):
-    # Too long measure
-    long_measure = "a" * 256
-    response = await client.post(
-        "/create",
-        data={
-            "measure": long_measure,
-            "options_raw": "A\nB",
-            "allow_write_in": False,
-            "start_time_type": "now",
-        },
-        headers={"X-CSRF-Token": "test-token"},
-    )
-    assert response.status_code == 200
-    assert "at most 255 characters" in response.text
-    assert long_measure in response.text  # Sticky value
-    assert "A\nB" in response.text  # Sticky options
-
-    # Empty measure
-    response = await client.post(
-        "/create",
-        data={
-            "measure": "",
-            "options_raw": "A\nB",
-            "allow_write_in": False,
-            "start_time_type": "now",
-        },
-        headers={"X-CSRF-Token": "test-token"},
-    )
-    assert response.status_code == 200
-    assert "at least 3 characters" in response.text
 
-
-async def test_options_count_validation(client: AsyncClient):
-    # Too few options
-    response = await client.post(
-        "/create",
-        data={
-            "measure": "Test Ballot",
-            "options_raw": "OneOption",
-            "allow_write_in": False,
-            "start_time_type": "now",
-        },
-        headers={"X-CSRF-Token": "test-token"},
-    )
-    assert response.status_code == 200
-    assert "at least 2 options" in response.text
-    assert "OneOption" in response.text
-
-
-async def test_option_length_validation(client: AsyncClient):
-    # Too long option
-    long_option = "a" * 65
-    # Provide 3 options so that even if one is invalid, we don't hit the "at least 2 options" error
-    # which seems to take precedence in the UI rendering.
-    response = await client.post(
-        "/create",
-        data={
-            "measure": "Test Ballot",
-            "options_raw": f"Valid1, Valid2, {long_option}",
-            "allow_write_in": False,
-            "start_time_type": "now",
-        },
-        headers={"X-CSRF-Token": "test-token"},
-    )
+@pytest.mark.parametrize(
+    ("overrides", "expected"),
+    [
+        # Too long measure; both fields stay sticky
+        (
+            {"measure": "a" * 256},
+            ["at most 255 characters", "a" * 256, "A\nB"],
+        ),
+        # Empty measure
+        ({"measure": ""}, ["at least 3 characters"]),
+        # Too few options
+        ({"options_raw": "OneOption"}, ["at least 2 options", "OneOption"]),
+        # Too long option. Three options so that even if one is invalid, we
+        # don't hit the "at least 2 options" error, which takes precedence
+        # in the UI rendering.
+        (
+            {"options_raw": f"Valid1, Valid2, {'a' * 65}"},
+            ["between 1 and 64 characters", "a" * 65],
+        ),
+    ],
+    ids=["measure_too_long", "measure_empty", "too_few_options", "option_too_long"],
+)
+async def test_create_form_validation(
+    client: AsyncClient, overrides: dict[str, str], expected: list[str]
+):
+    response = await client.post("/create", data={**_VALID_FORM, **overrides})
     assert response.status_code == 200
-    assert "between 1 and 64 characters" in response.text
-    assert long_option in response.text
+    for text in expected:
+        assert text in response.text
 
 
 async def test_vote_write_in_length_validation(client: AsyncClient):
@@ -81,7 +50,6 @@ async def test_vote_write_in_length_validation(client: AsyncClient):
             "allow_write_in": True,
             "start_time_type": "now",
         },
-        headers={"X-CSRF-Token": "test-token"},
     )
     ballot_id = create_resp.headers["location"].split("/")[-1]
 
@@ -90,7 +58,6 @@ async def test_vote_write_in_length_validation(client: AsyncClient):
     vote_resp = await client.post(
         f"/vote/{ballot_id}",
         data={"option_id": "__write_in__", "write_in_value": long_write_in},
-        headers={"X-CSRF-Token": "test-token"},
     )
 
     assert vote_resp.status_code == 200
@@ -111,7 +78,6 @@ async def test_scheduled_start_time_persistence(client: AsyncClient):
             "start_time_type": "scheduled",
             "scheduled_start_time": "2025-01-01T12:00:00+00:00",
         },
-        headers={"X-CSRF-Token": "test-token"},
     )
 
     assert response.status_code == 200
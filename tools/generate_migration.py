@@ -1,7 +1,9 @@
 import os
-import subprocess
 import sys
 from typing import Optional
+
+from alembic import command
+from alembic.config import Config
 from testcontainers.postgres import PostgresContainer
 
 
@@ -12,27 +14,39 @@ def run_migration_generation(message: Optional[str] = None):
     """
     msg = message or "auto_migration"
 
-    with PostgresContainer("postgres:16-alpine") as postgres:
+    # Throwaway schema-only database: keep PGDATA in memory and skip the
+    # durability work (fsync, WAL full-page writes) nobody will rely on
+    container = (
+        PostgresContainer("postgres:16-alpine")
+        .with_kwargs(tmpfs={"/var/lib/postgresql/data": "rw"})
+        .with_command(
+            "postgres -c fsync=off -c synchronous_commit=off -c full_page_writes=off"
+        )
+    )
+
+    with container as postgres:
         db_url = postgres.get_connection_url().replace("psycopg2", "asyncpg")
 
-        # Inject the temp DB URL into environment for Alembic
-        env = os.environ.copy()
-        env["DATABASE_URL"] = db_url
+        # Point Alembic's env.py at the temp DB; both commands run in this
+        # process, so models and metadata are only imported once
+        previous_url = os.environ.get("DATABASE_URL")
+        os.environ["DATABASE_URL"] = db_url
+        cfg = Config("alembic.ini")
 
         print(f"Ephemeral Postgres started: {db_url}")
 
-        # 1. Bring temp DB to current HEAD
-        subprocess.run(
-            [sys.executable, "-m", "alembic", "upgrade", "head"], env=env, check=True
-        )
-
-        # 2. Generate new revision
-        print(f"Generating revision: {msg}")
-        subprocess.run(
-            [sys.executable, "-m", "alembic", "revision", "--autogenerate", "-m", msg],
-            env=env,
-            check=True,
-        )
+        try:
+            # 1. Bring temp DB to current HEAD
+            command.upgrade(cfg, "head")
+
+            # 2. Generate new revision
+            print(f"Generating revision: {msg}")
+            _ = command.revision(cfg, message=msg, autogenerate=True)
+        finally:
+            if previous_url is None:
+                _ = os.environ.pop("DATABASE_URL", None)
+            else:
+                os.environ["DATABASE_URL"] = previous_url
 
 
 if __name__ == "__main__":
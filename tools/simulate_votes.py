@@ -1,66 +1,84 @@
+import asyncio
 import random
 import sys
-import time
 from typing import Any
 
 import httpx
 from bs4 import BeautifulSoup  # type: ignore
 
+# Votes in flight at once (1 casts them one after another)
+DEFAULT_CONCURRENCY = 20
 
-def cast_single_vote(
-    base_url: str, ballot_id: str, options: list[str], allow_write_in: bool
-) -> bool:
-    """Casts a single vote using a fresh session to bypass cookie-based vote limiting."""
-    with httpx.Client(base_url=base_url, follow_redirects=True) as client:
-        try:
-            # 1. Get the vote page to fetch a fresh CSRF token
-            response = client.get(f"/vote/{ballot_id}")
-            response.raise_for_status()
+CSRF_COOKIE_NAME = "oponn_csrf_token"
 
-            csrf_token = client.cookies.get("oponn_csrf_token")
-
-            # 2. Prepare vote data
-            data: dict[str, Any] = {}
-            display_option: str = ""
-
-            if allow_write_in and random.random() < 0.2:
-                vote_option = "__write_in__"
-                write_in_value = f"Sim-Write-in-{random.randint(1, 100)}"
-                data = {"option_id": vote_option, "write_in_value": write_in_value}
-                display_option = write_in_value
-            else:
-                if not options:
-                    print("No options found for this ballot")
-                    return False
-                vote_option = random.choice(options)
-                data = {"option_id": vote_option}
-                display_option = vote_option
-
-            # 3. Post the vote
-            headers = {"X-CSRF-Token": csrf_token} if csrf_token else {}
-            response = client.post(f"/vote/{ballot_id}", data=data, headers=headers)
-            response.raise_for_status()
-
-            print(f"Cast vote for '{display_option}'")
-            return True
-
-        except Exception as e:
-            print(f"Error casting vote: {e}")
-            return False
 
-
-def simulate(ballot_id: str, num_votes: int = 10) -> None:
+async def cast_single_vote(
+    base_url: str,
+    transport: httpx.AsyncHTTPTransport,
+    ballot_id: str,
+    options: list[str],
+    allow_write_in: bool,
+    csrf_token: str | None,
+) -> bool:
+    """
+    Casts a single vote with a fresh cookie jar to bypass cookie-based vote
+    limiting. The connection pool underneath is shared across votes.
+    """
+    # Not closed: closing a client would also close the shared transport
+    cookies = {CSRF_COOKIE_NAME: csrf_token} if csrf_token else {}
+    client = httpx.AsyncClient(
+        base_url=base_url, transport=transport, cookies=cookies, follow_redirects=True
+    )
+    try:
+        # 1. Prepare vote data
+        data: dict[str, Any] = {}
+        display_option: str = ""
+
+        if allow_write_in and random.random() < 0.2:
+            vote_option = "__write_in__"
+            write_in_value = f"Sim-Write-in-{random.randint(1, 100)}"
+            data = {"option_id": vote_option, "write_in_value": write_in_value}
+            display_option = write_in_value
+        else:
+            if not options:
+                print("No options found for this ballot")
+                return False
+            vote_option = random.choice(options)
+            data = {"option_id": vote_option}
+            display_option = vote_option
+
+        # 2. Post the vote
+        headers = {"X-CSRF-Token": csrf_token} if csrf_token else {}
+        response = await client.post(f"/vote/{ballot_id}", data=data, headers=headers)
+        response.raise_for_status()
+
+        print(f"Cast vote for '{display_option}'")
+        return True
+
+    except Exception as e:
+        print(f"Error casting vote: {e}")
+        return False
+
+
+async def simulate_async(
+    ballot_id: str, num_votes: int = 10, concurrency: int = DEFAULT_CONCURRENCY
+) -> None:
     base_url = "http://localhost:8000"
 
-    # Initial fetch to get ballot metadata
+    # Initial fetch to get ballot metadata, plus a CSRF token for every vote
+    # (the check is a plain double-submit, so one token serves them all)
     options: list[str] = []
     allow_write_in = False
     measure = ""
+    csrf_token: str | None = None
 
-    with httpx.Client(base_url=base_url) as client:
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncHTTPTransport(limits=limits) as transport:
+        client = httpx.AsyncClient(base_url=base_url, transport=transport)
         try:
-            response = client.get(f"/vote/{ballot_id}")
+            response = await client.get(f"/vote/{ballot_id}")
             response.raise_for_status()
+            csrf_token = client.cookies.get(CSRF_COOKIE_NAME)
 
             soup = BeautifulSoup(response.text, "html.parser")
             h2 = soup.find("h2")
@@ -78,17 +96,25 @@ def simulate(ballot_id: str, num_votes: int = 10) -> None:
             print(f"Error fetching ballot metadata: {e}")
             return
 
-    print(f"Simulating {num_votes} votes for ballot: {measure}")
+        print(f"Simulating {num_votes} votes for ballot: {measure}")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded_vote() -> bool:
+            async with semaphore:
+                return await cast_single_vote(
+                    base_url, transport, ballot_id, options, allow_write_in, csrf_token
+                )
+
+        results = await asyncio.gather(*(bounded_vote() for _ in range(num_votes)))
 
-    success_count = 0
-    for i in range(num_votes):
-        if cast_single_vote(base_url, ballot_id, options, allow_write_in):
-            success_count += 1
+    print(f"Simulation complete: {sum(results)}/{num_votes} votes cast.")
 
-        if i < num_votes - 1:
-            time.sleep(0.2)
 
-    print(f"Simulation complete: {success_count}/{num_votes} votes cast.")
+def simulate(
+    ballot_id: str, num_votes: int = 10, concurrency: int = DEFAULT_CONCURRENCY
+) -> None:
+    asyncio.run(simulate_async(ballot_id, num_votes, concurrency))
 
 
 if __name__ == "__main__":